@@ -1,14 +1,24 @@
 """Core AOP information classes."""
 
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 from pyaop.aop.constants import EdgeType, NodeType
 
+_NODE_MIE = NodeType.MIE
+_NODE_AO = NodeType.AO
+_KER_EDGE_TYPE = EdgeType.KER.value
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True, eq=False)
 class AOPInfo:
-    """Represents AOP metadata."""
+    """Represents AOP metadata.
+
+    Instances compare and hash by ``aop_id`` only, since the ID identifies an
+    AOP everywhere in the network.
+    """
 
     aop_id: str
     title: str
@@ -18,10 +28,71 @@ class AOPInfo:
         """Perform basic validation after initialization."""
         if not self.aop_id or not self.uri:
             raise ValueError("AOP ID and URI are required")
+        # The same AOP strings recur across many KEs, so share one copy of each
+        object.__setattr__(self, "aop_id", sys.intern(self.aop_id))
+        object.__setattr__(self, "title", sys.intern(self.title))
+        object.__setattr__(self, "uri", sys.intern(self.uri))
 
     def __str__(self) -> str:
         return f"AOP(id:{self.aop_id}, title:'{self.title}', URI:{self.uri})"
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AOPInfo):
+            return NotImplemented
+        return self.aop_id == other.aop_id
+
+    def __hash__(self) -> int:
+        return hash(self.aop_id)
+
+    @classmethod
+    def _create_unchecked(cls, aop_id: str, title: str, uri: str) -> "AOPInfo":
+        """Create an instance without running ``__init__`` and its validation.
+
+        Args:
+            aop_id: AOP ID, must be non-empty.
+            title: AOP title.
+            uri: AOP URI, must be non-empty.
+
+        Returns:
+            AOPInfo object.
+        """
+        aop_info = cls.__new__(cls)
+        object.__setattr__(aop_info, "aop_id", aop_id)
+        object.__setattr__(aop_info, "title", sys.intern(title))
+        object.__setattr__(aop_info, "uri", uri)
+        return aop_info
+
+    @staticmethod
+    def _node_aop_lists(element: dict[str, Any]) -> tuple[list[Any], list[Any]] | None:
+        """Get the aligned AOP URI and title lists of a node element.
+
+        Args:
+            element: Cytoscape element.
+
+        Returns:
+            Tuple of AOP URIs and titles, or None if the element is an edge,
+            has no AOPs, or its lists are misaligned.
+        """
+        if element.get("group") == "edges":
+            return None
+        data = element.get("data")
+        if not data:
+            return None
+        # Extract AOP information from node data
+        aop_uris = data.get("aop_uris")
+        aop_titles = data.get("aop_titles")
+        if not aop_uris or not aop_titles:
+            return None
+        # Handle single values as well as lists
+        if type(aop_uris) is not list:
+            aop_uris = [aop_uris]
+        if type(aop_titles) is not list:
+            aop_titles = [aop_titles]
+        # Skip nodes whose URI and title lists are misaligned
+        if len(aop_uris) != len(aop_titles):
+            return None
+        return aop_uris, aop_titles
+
     @classmethod
     def from_cytoscape_elements(cls, elements: list[dict[str, Any]]) -> list["AOPInfo"]:
         """Parse AOP information from Cytoscape elements.
@@ -32,34 +103,51 @@ class AOPInfo:
         Returns:
             List of AOPInfo objects.
         """
-        aop_infos = {}  # Use dict to avoid duplicates
+        seen_ids: set[str] = set()  # Track IDs to avoid duplicates
+        aop_infos: list[AOPInfo] = []
         for element in elements:
-            if element.get("group") != "edges" and "data" in element:
-                data = element["data"]
-                # Extract AOP information from node data
-                aop_uris = data.get("aop_uris", [])
-                aop_titles = data.get("aop_titles", [])
-                # Handle single values as well as lists
-                if not isinstance(aop_uris, list):
-                    aop_uris = [aop_uris] if aop_uris else []
-                if not isinstance(aop_titles, list):
-                    aop_titles = [aop_titles] if aop_titles else []
-                # Process each AOP URI/title pair
-                for aop_uri, aop_title in zip(aop_uris, aop_titles, strict=True):
-                    if aop_uri and aop_title:
-                        # Extract AOP ID from URI
-                        aop_id = aop_uri.split("/")[-1] if "/" in aop_uri else aop_uri
-                        # Create AOPInfo if not already exists
-                        if aop_id not in aop_infos:
-                            try:
-                                aop_info = cls(aop_id=aop_id, title=aop_title, uri=aop_uri)
-                                aop_infos[aop_id] = aop_info
-                            except ValueError:
-                                return []
-        return list(aop_infos.values())
-
-
-@dataclass
+            aop_lists = cls._node_aop_lists(element)
+            if aop_lists is None:
+                continue
+            aop_uris, aop_titles = aop_lists
+            # Process each AOP URI/title pair
+            for aop_uri, aop_title in zip(aop_uris, aop_titles, strict=False):
+                if not aop_uri or not aop_title:
+                    continue
+                # Extract AOP ID from URI
+                aop_uri = sys.intern(aop_uri)
+                aop_id = sys.intern(aop_uri.rpartition("/")[2])
+                # An empty ID would fail validation; skip the pair, not the parse
+                if not aop_id or aop_id in seen_ids:
+                    continue
+                seen_ids.add(aop_id)
+                if cls is AOPInfo:
+                    aop_infos.append(_get_aop_info(aop_id, aop_title, aop_uri))
+                else:
+                    # Subclasses may add fields or validation, so run their __init__
+                    aop_infos.append(cls(aop_id, aop_title, aop_uri))
+        return aop_infos
+
+
+@lru_cache(maxsize=4096)
+def _get_aop_info(aop_id: str, title: str, uri: str) -> AOPInfo:
+    """Return a shared AOPInfo instance for the given fields.
+
+    The cache is bounded so a long-running process that reloads networks
+    does not keep every AOPInfo it has ever parsed alive.
+
+    Args:
+        aop_id: AOP ID, must be non-empty.
+        title: AOP title.
+        uri: AOP URI, must be non-empty.
+
+    Returns:
+        AOPInfo object, reused across calls with the same arguments.
+    """
+    return AOPInfo._create_unchecked(aop_id, title, uri)
+
+
+@dataclass(slots=True)
 class AOPKeyEvent:
     """Represents a Key Event in an AOP."""
 
@@ -68,6 +156,11 @@ class AOPKeyEvent:
     title: str
     ke_type: NodeType
     associated_aops: list[AOPInfo] = field(default_factory=list)
+    _aop_set: set[AOPInfo] = field(default_factory=set, init=False, repr=False, compare=False)
+    _aop_uris: list[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _aop_titles: list[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _cyto_cache: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+    _str: str = field(default="", init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Perform basic validation after initialization."""
@@ -75,9 +168,27 @@ class AOPKeyEvent:
             raise ValueError("Key Event ID and URI are required")
         if not self.title:
             self.title = self.ke_id  # Use ID as fallback
+        self._aop_set.update(self.associated_aops)
+        self._aop_uris.extend(aop.uri for aop in self.associated_aops)
+        self._aop_titles.extend(aop.title for aop in self.associated_aops)
+        self._str = f"{self.ke_type.value}:{self.ke_id}"
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        # Public fields feed the cached Cytoscape data and string form
+        if name[0] != "_":
+            object.__setattr__(self, "_cyto_cache", None)
+            object.__setattr__(self, "_str", "")
+            # Keep the membership set and URI/title lists in step with a new AOP list
+            if name == "associated_aops":
+                object.__setattr__(self, "_aop_set", set(value))
+                object.__setattr__(self, "_aop_uris", [aop.uri for aop in value])
+                object.__setattr__(self, "_aop_titles", [aop.title for aop in value])
 
     def __str__(self) -> str:
-        return f"{self.ke_type.value}:{self.ke_id}"
+        if not self._str:
+            self._str = f"{self.ke_type.value}:{self.ke_id}"
+        return self._str
 
     def add_aop(self, aop_info: AOPInfo) -> bool:
         """Add AOP association.
@@ -88,8 +199,12 @@ class AOPKeyEvent:
         Returns:
             True if added, False if exists.
         """
-        if aop_info not in self.associated_aops:
+        # Set lookup keeps membership O(1); the list preserves insertion order
+        if aop_info not in self._aop_set:
+            self._aop_set.add(aop_info)
             self.associated_aops.append(aop_info)
+            self._aop_uris.append(aop_info.uri)
+            self._aop_titles.append(aop_info.title)
             return True
         return False
 
@@ -104,21 +219,30 @@ class AOPKeyEvent:
     def to_cytoscape_data(self) -> dict[str, Any]:
         """Convert to Cytoscape node data.
 
+        The fields derived from the ID, URI, title and type are cached until one
+        of them is reassigned. Each call returns a new dict with fresh copies of
+        the AOP URI and title lists, so callers may modify the result.
+
         Returns:
             Dictionary for Cytoscape node data.
         """
+        if self._cyto_cache is None:
+            ke_type = self.ke_type
+            self._cyto_cache = {
+                "id": self.uri,
+                "label": self.title,
+                "type": ke_type.value,
+                "is_mie": ke_type is _NODE_MIE,
+                "is_ao": ke_type is _NODE_AO,
+            }
         return {
-            "id": self.uri,
-            "label": self.title,
-            "type": self.ke_type.value,
-            "is_mie": self.ke_type == NodeType.MIE,
-            "is_ao": self.ke_type == NodeType.AO,
-            "aop_uris": [aop.uri for aop in self.associated_aops],
-            "aop_titles": [aop.title for aop in self.associated_aops],
+            **self._cyto_cache,
+            "aop_uris": list(self._aop_uris),
+            "aop_titles": list(self._aop_titles),
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyEventRelationship:
     """Represents a relationship between two Key Events."""
 
@@ -126,6 +250,9 @@ class KeyEventRelationship:
     ker_uri: str
     upstream_ke: AOPKeyEvent
     downstream_ke: AOPKeyEvent
+    _str: str = field(default="", init=False, repr=False, compare=False)
+    _edge_id: str = field(default="", init=False, repr=False, compare=False)
+    _curie: str = field(default="", init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Perform basic validation after initialization."""
@@ -133,9 +260,12 @@ class KeyEventRelationship:
             raise ValueError("KER ID and URI are required")
         if self.upstream_ke.uri == self.downstream_ke.uri:
             raise ValueError("Upstream and downstream KEs cannot be the same")
+        self._str = f"KER:{self.ker_id}"
+        self._edge_id = f"{self.upstream_ke.uri}_{self.downstream_ke.uri}"
+        self._curie = f"aop.relationships:{self.ker_id}"
 
     def __str__(self) -> str:
-        return f"KER:{self.ker_id}"
+        return self._str
 
     def to_cytoscape_data(self) -> dict[str, Any]:
         """Convert to Cytoscape edge data.
@@ -144,10 +274,10 @@ class KeyEventRelationship:
             Dictionary for Cytoscape edge data.
         """
         return {
-            "id": f"{self.upstream_ke.uri}_{self.downstream_ke.uri}",
+            "id": self._edge_id,
             "source": self.upstream_ke.uri,
             "target": self.downstream_ke.uri,
-            "curie": f"aop.relationships:{self.ker_id}",
+            "curie": self._curie,
             "ker_label": self.ker_id,
-            "type": EdgeType.KER.value,
+            "type": _KER_EDGE_TYPE,
         }
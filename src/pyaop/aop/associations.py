@@ -8,29 +8,581 @@ Outcome Pathways (AOPs).
 
 from __future__ import annotations
 
-import logging
+import json
+import re
+import sys
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
-from dataclasses import dataclass
-from typing import Any
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, ClassVar
 
 from pyaop.aop.constants import EdgeType, NodeType
 from pyaop.cytoscape.elements import CytoscapeEdge, CytoscapeNode
 
-logger = logging.getLogger(__name__)
+# Enum values used while building elements, resolved once at import
+_GENE_TYPE = NodeType.GENE.value
+_PROTEIN_TYPE = NodeType.PROTEIN.value
+_CHEMICAL_TYPE = NodeType.CHEMICAL.value
+_ORGAN_TYPE = NodeType.ORGAN.value
+_CELL_TYPE = NodeType.CELL.value
+_CELL_COMP_TYPE = NodeType.CELL_COMP.value
+_COMP_PROC_TYPE = NodeType.COMP_PROC.value
+_COMP_OBJ_TYPE = NodeType.COMP_OBJ.value
+_TRANSLATES_TO_TYPE = EdgeType.TRANSLATES_TO.value
+_PART_OF_TYPE = EdgeType.PART_OF.value
+_HAS_PROCESS_TYPE = EdgeType.HAS_PROCESS.value
+_INVOLVES_TYPE = EdgeType.INVOLVES.value
+_IS_STRESSOR_OF_TYPE = EdgeType.IS_STRESSOR_OF.value
+_EXPRESSION_IN_TYPE = EdgeType.EXPRESSION_IN.value
+_ASSOCIATED_WITH_TYPE = EdgeType.ASSOCIATED_WITH.value
+_COMPONENT_ACTIONS = frozenset(EdgeType.get_component_actions())
+# Node types a component object can take; merged in order, later types win on ID clashes
+_COMP_OBJECT_NODE_TYPES = (
+    _COMP_OBJ_TYPE,
+    _ORGAN_TYPE,
+    _CELL_TYPE,
+    _PROTEIN_TYPE,
+    _CELL_COMP_TYPE,
+)
+
+# Cytoscape classes shared by every node of a kind
+_GENE_NODE_CLASS = sys.intern("gene-node")
+_PROTEIN_NODE_CLASS = sys.intern("protein-node")
+_CHEMICAL_NODE_CLASS = sys.intern("chemical-node")
+_ORGAN_NODE_CLASS = sys.intern("organ-node")
+_ORGAN_OBJECT_CLASSES = sys.intern(f"{_ORGAN_TYPE} {_COMP_OBJ_TYPE}")
+_CELL_OBJECT_CLASSES = sys.intern(f"{_CELL_TYPE} {_COMP_OBJ_TYPE}")
+_PROTEIN_OBJECT_CLASSES = sys.intern(f"{_PROTEIN_TYPE} {_COMP_OBJ_TYPE}")
+_CELL_COMP_OBJECT_CLASSES = sys.intern(f"{_CELL_COMP_TYPE} {_COMP_OBJ_TYPE}")
+
+# Edge labels repeated across every gene association
+_PART_OF_LABEL = sys.intern("part of")
+_TRANSLATES_TO_LABEL = sys.intern("translates to")
+
+# json.dumps builds a new encoder whenever options are passed; reuse a single one
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_KE_URI_PREFIX = "https://identifiers.org/aop.events/"
+_ORGAN_CONTEXT = "http://aopkb.org/aop_ontology#OrganContext"
+_CELL_OBJECT_NAMES = frozenset({"cell", "mitochondrion"})
+# One group per object kind, in precedence order: organ, cell, protein, cellular component.
+# No needle can overlap another, so a single non-overlapping scan sees every needle present.
+_OBJECT_PREFIX_RE = re.compile("(FMA|UBERON)|(CL|EFO)|(PR)|(GO)")
+_ORGAN_RANK, _CELL_RANK, _PROTEIN_RANK, _CELL_COMP_RANK = 1, 2, 3, 4
+
+
+def _object_prefix_rank(object_id: str) -> int:
+    """Return the highest-precedence ontology needle group found in an object ID.
+
+    Args:
+        object_id: Object ID, i.e. the last segment of the IRI.
+
+    Returns:
+        Group number of ``_OBJECT_PREFIX_RE``, or 0 when nothing matches.
+    """
+    rank = 0
+    for match in _OBJECT_PREFIX_RE.finditer(object_id):
+        group = match.lastindex or 0
+        if group == _ORGAN_RANK:
+            return group
+        if not rank or group < rank:
+            rank = group
+    return rank
+
+
+def _classify_object(
+    object_iri: str, object_type: str, object_id: str, object_name: str
+) -> tuple[str, str]:
+    """Determine the node type and classes of a component object.
+
+    Hacky patch for misassigned types in AOP WIKI RDF: the ontology prefix of
+    the object ID takes precedence alongside the declared object type.
+
+    Args:
+        object_iri: Object IRI.
+        object_type: Declared object type IRI.
+        object_id: Object ID, i.e. the last segment of the IRI.
+        object_name: Object name.
+
+    Returns:
+        Tuple of node type and Cytoscape classes.
+    """
+    if object_type == _ORGAN_CONTEXT:
+        return _ORGAN_TYPE, _ORGAN_OBJECT_CLASSES
+    rank = _object_prefix_rank(object_id)
+    if rank == _ORGAN_RANK:
+        return _ORGAN_TYPE, _ORGAN_OBJECT_CLASSES
+    if rank == _CELL_RANK or "CellTypeContext" in object_type or object_name in _CELL_OBJECT_NAMES:
+        return _CELL_TYPE, _CELL_OBJECT_CLASSES
+    if rank == _PROTEIN_RANK or object_iri.endswith("PATO_0001241"):
+        return _PROTEIN_TYPE, _PROTEIN_OBJECT_CLASSES
+    if rank == _CELL_COMP_RANK:
+        return _CELL_COMP_TYPE, _CELL_COMP_OBJECT_CLASSES
+    # Default to component object type
+    return _COMP_OBJ_TYPE, _COMP_OBJ_TYPE
+
+
+@lru_cache(maxsize=4096)
+def _uri_tail(uri: str) -> str:
+    """Get the last path segment of a URI.
+
+    Args:
+        uri: URI string.
+
+    Returns:
+        Text after the last ``/``, or the whole string if it has none.
+    """
+    return uri.rpartition("/")[2]
+
+
+@lru_cache(maxsize=32)
+def _expr_label(expression_level: str) -> str:
+    """Get the label of an expression edge.
+
+    Args:
+        expression_level: Expression level.
+
+    Returns:
+        Edge label, shared between edges with the same expression level.
+    """
+    return sys.intern(f"expressed in ({expression_level})")
+
+
+def _value_or(data: dict[str, Any], key: str, fallback_key: str) -> Any:
+    """Get ``data[key]``, falling back to ``data[fallback_key]`` or ``""``.
+
+    Unlike ``data.get(key, data.get(fallback_key, ""))``, the fallback is
+    only looked up when ``key`` is missing.
+
+    Args:
+        data: Node or edge data.
+        key: Preferred key.
+        fallback_key: Key used when ``key`` is missing.
+
+    Returns:
+        The value found, or an empty string.
+    """
+    if key in data:
+        return data[key]
+    return data.get(fallback_key, "")
+
+
+def _make_node(
+    node_id: str, label: str, node_type: str, classes: str, **extras: Any
+) -> dict[str, Any]:
+    """Build a Cytoscape node element.
+
+    Args:
+        node_id: Node ID.
+        label: Node label.
+        node_type: Node type.
+        classes: CSS classes.
+        **extras: Additional data fields, placed after the common ones.
+
+    Returns:
+        Dictionary representing the node.
+    """
+    return {
+        "data": {"id": node_id, "label": label, "type": node_type, **extras},
+        "classes": classes,
+    }
+
+
+def _make_edge(
+    edge_id: str, source: str, target: str, label: str, edge_type: str, **extras: Any
+) -> dict[str, Any]:
+    """Build a Cytoscape edge element.
+
+    Args:
+        edge_id: Edge ID.
+        source: Source node ID.
+        target: Target node ID.
+        label: Edge label.
+        edge_type: Edge type.
+        **extras: Additional data fields, placed after the common ones.
+
+    Returns:
+        Dictionary representing the edge.
+    """
+    return {
+        "data": {
+            "id": edge_id,
+            "source": source,
+            "target": target,
+            "label": label,
+            "type": edge_type,
+            **extras,
+        }
+    }
+
+
+def _iter_gene_elements_no_protein(ke_uri: str, gene_id: str) -> Iterator[dict[str, Any]]:
+    """Build the Cytoscape elements of a gene association without a protein.
+
+    Args:
+        ke_uri: Key Event URI.
+        gene_id: Gene ID.
+
+    Yields:
+        Dictionaries representing Cytoscape elements.
+    """
+    gene_node_id = f"gene_{gene_id}"
+    yield _make_node(gene_node_id, gene_id, _GENE_TYPE, _GENE_NODE_CLASS, gene_id=gene_id)
+
+    # Direct gene to KE connection
+    yield _make_edge(
+        f"{gene_node_id}_{ke_uri}", gene_node_id, ke_uri, _PART_OF_LABEL, _PART_OF_TYPE
+    )
+
+
+def _iter_gene_elements_with_protein(
+    ke_uri: str, gene_id: str, protein_id: str
+) -> Iterator[dict[str, Any]]:
+    """Build the Cytoscape elements of a gene association through a protein.
+
+    Args:
+        ke_uri: Key Event URI.
+        gene_id: Gene ID.
+        protein_id: Protein ID.
+
+    Yields:
+        Dictionaries representing Cytoscape elements.
+    """
+    gene_node_id = f"gene_{gene_id}"
+    yield _make_node(gene_node_id, gene_id, _GENE_TYPE, _GENE_NODE_CLASS, gene_id=gene_id)
+
+    # Protein node
+    protein_node_id = f"protein_{protein_id}"
+    yield _make_node(
+        protein_node_id, protein_id, _PROTEIN_TYPE, _PROTEIN_NODE_CLASS, protein_id=protein_id
+    )
+
+    # Translates to edge
+    yield _make_edge(
+        f"{gene_node_id}_{protein_node_id}",
+        gene_node_id,
+        protein_node_id,
+        _TRANSLATES_TO_LABEL,
+        _TRANSLATES_TO_TYPE,
+    )
+
+    # Part of edge (protein to KE)
+    yield _make_edge(
+        f"{protein_node_id}_{ke_uri}", protein_node_id, ke_uri, _PART_OF_LABEL, _PART_OF_TYPE
+    )
+
+
+def _iter_gene_elements(
+    ke_uri: str, gene_id: str, protein_id: str | None
+) -> Iterator[dict[str, Any]]:
+    """Build the Cytoscape elements of a gene association.
+
+    Args:
+        ke_uri: Key Event URI.
+        gene_id: Gene ID.
+        protein_id: Protein ID, if any.
+
+    Returns:
+        Iterator over dictionaries representing Cytoscape elements.
+    """
+    # Protein node and relationships only if proteins are included
+    if protein_id and protein_id != "NA":
+        return _iter_gene_elements_with_protein(ke_uri, gene_id, protein_id)
+    return _iter_gene_elements_no_protein(ke_uri, gene_id)
+
+
+def _iter_component_elements_from_ids(
+    ke_uri: str,
+    ke_id: str,
+    process_iri: str,
+    process: str,
+    process_name: str,
+    object_iri: str,
+    object_n: str,
+    object_name: str,
+    action: str,
+    object_type: str,
+) -> Iterator[dict[str, Any]]:
+    """Build the Cytoscape elements of a component association from parsed IDs.
+
+    Args:
+        ke_uri: Key Event URI.
+        ke_id: Key Event ID, the last segment of ``ke_uri``.
+        process_iri: Process IRI.
+        process: Process ID, the last segment of ``process_iri``.
+        process_name: Process name.
+        object_iri: Object IRI, may be empty.
+        object_n: Object ID, the last segment of ``object_iri``.
+        object_name: Object name.
+        action: Action label.
+        object_type: Declared object type IRI.
+
+    Yields:
+        Dictionaries representing Cytoscape elements.
+    """
+    if not process_iri:  # DROP components with empty process IRI
+        return
+    ke = "aop.events_" + ke_id
+    process_node_id = f"process_{process}"
+
+    yield _make_node(
+        process_node_id,
+        process_name,
+        _COMP_PROC_TYPE,
+        _COMP_PROC_TYPE,
+        process_iri=process_iri,
+        process_name=process_name,
+        process_id=process,
+    )
+
+    # Determine edge label
+    edge_label = action if action in _COMPONENT_ACTIONS else _HAS_PROCESS_TYPE
+
+    # KE -> Process edge (action)
+    yield _make_edge(
+        f"{ke}_{process_node_id}", ke_uri, process_node_id, edge_label, _HAS_PROCESS_TYPE
+    )
+
+    if object_iri:
+        object_node_id = f"object_{object_n}"
+
+        object_node_type, obj_cls = _classify_object(object_iri, object_type, object_n, object_name)
+
+        yield _make_node(
+            object_node_id,
+            object_name,
+            object_node_type,
+            obj_cls,
+            object_iri=object_iri,
+            object_name=object_name,
+            object_id=object_n,
+        )
+
+        # NEW: KE -> Object edge instead of Process -> Object
+        yield _make_edge(
+            f"{ke}_{object_node_id}", ke_uri, object_node_id, _INVOLVES_TYPE, _INVOLVES_TYPE
+        )
+
+
+def _iter_component_elements(
+    ke_uri: str,
+    process_iri: str,
+    process_name: str,
+    object_iri: str,
+    object_name: str,
+    action: str,
+    object_type: str,
+) -> Iterator[dict[str, Any]]:
+    """Build the Cytoscape elements of a component association.
+
+    Args:
+        ke_uri: Key Event URI.
+        process_iri: Process IRI.
+        process_name: Process name.
+        object_iri: Object IRI, may be empty.
+        object_name: Object name.
+        action: Action label.
+        object_type: Declared object type IRI.
+
+    Returns:
+        Iterator over dictionaries representing Cytoscape elements.
+    """
+    # Skip parsing the IRIs of components that are dropped or have no object
+    if not process_iri:
+        return iter(())
+    return _iter_component_elements_from_ids(
+        ke_uri,
+        _uri_tail(ke_uri),
+        process_iri,
+        _uri_tail(process_iri),
+        process_name,
+        object_iri,
+        _uri_tail(object_iri) if object_iri else "",
+        object_name,
+        action,
+        object_type,
+    )
+
+
+def _iter_compound_elements(
+    aop_uri: str,
+    mie_uri: str,
+    chemical_uri: str,
+    chemical_label: str,
+    pubchem_compound: str,
+    compound_name: str,
+    cas_id: str | None,
+) -> Iterator[dict[str, Any]]:
+    """Build the Cytoscape elements of a compound association.
+
+    Args:
+        aop_uri: AOP URI.
+        mie_uri: MIE URI, may be empty.
+        chemical_uri: Chemical URI.
+        chemical_label: Chemical label.
+        pubchem_compound: PubChem compound URI.
+        compound_name: Compound name.
+        cas_id: CAS ID, if any.
+
+    Yields:
+        Dictionaries representing Cytoscape elements.
+    """
+    # Extract identifiers
+    pubchem_id = _uri_tail(pubchem_compound)
+    chemical_node_id = f"chemical_{pubchem_id}"
+
+    # Chemical node - include aop_uri and chemical_uri for back-parsing
+    yield _make_node(
+        chemical_node_id,
+        compound_name or chemical_label,
+        _CHEMICAL_TYPE,
+        _CHEMICAL_NODE_CLASS,
+        pubchem_id=pubchem_id,
+        cas_id=cas_id,
+        chemical_label=chemical_label,
+        compound_name=compound_name,
+        pubchem_compound=pubchem_compound,
+        aop_uri=aop_uri,
+        chemical_uri=chemical_uri,
+    )
+
+    # Edge from chemical to MIE
+    if mie_uri:
+        yield _make_edge(
+            f"{chemical_node_id}_{mie_uri}",
+            chemical_node_id,
+            mie_uri,
+            _IS_STRESSOR_OF_TYPE,
+            _IS_STRESSOR_OF_TYPE,
+        )
 
 
-@dataclass
+def _iter_gene_expression_elements(
+    gene_id: str,
+    anatomical_id: str,
+    anatomical_name: str,
+    expression_level: str,
+    confidence_level_name: str,
+    developmental_stage_name: str,
+) -> Iterator[dict[str, Any]]:
+    """Build the Cytoscape elements of a gene expression association.
+
+    Args:
+        gene_id: Gene ID.
+        anatomical_id: Anatomical entity ID.
+        anatomical_name: Anatomical entity name.
+        expression_level: Expression level.
+        confidence_level_name: Confidence level name.
+        developmental_stage_name: Developmental stage name.
+
+    Yields:
+        Dictionaries representing Cytoscape elements.
+    """
+    # Organ node
+    organ_node_id = f"{anatomical_id}"
+    yield _make_node(
+        organ_node_id,
+        anatomical_name,
+        _ORGAN_TYPE,
+        _ORGAN_NODE_CLASS,
+        anatomical_id=anatomical_id,
+        anatomical_name=anatomical_name,
+    )
+
+    # Expression edge from gene to organ
+    gene_node_id = f"gene_{gene_id}"
+    yield _make_edge(
+        f"{gene_node_id}_{organ_node_id}_expression",
+        gene_node_id,
+        organ_node_id,
+        _expr_label(expression_level),
+        _EXPRESSION_IN_TYPE,
+        expression_level=expression_level,
+        confidence_level=confidence_level_name,
+        developmental_stage=developmental_stage_name,
+    )
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class BaseAssociation(ABC):
-    """Abstract base class for all association types."""
+    """Abstract base class for all association types.
+
+    Associations are immutable: assigning to a field raises
+    ``dataclasses.FrozenInstanceError``, so use ``dataclasses.replace`` to
+    derive a modified copy. Subclasses compare and hash by the fields returned
+    from ``_natural_key``, which cover every field that distinguishes one
+    association from another.
+    """
 
     @abstractmethod
+    def _natural_key(self) -> tuple[Any, ...]:
+        """Get the fields that identify this association.
+
+        Returns:
+            Tuple of identifying field values.
+        """
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._natural_key() == other._natural_key()
+
+    def __hash__(self) -> int:
+        return hash(self._natural_key())
+
+    @abstractmethod
+    def iter_cytoscape_elements(self) -> Iterator[dict[str, Any]]:
+        """Iterate over Cytoscape elements (nodes and edges) one at a time.
+
+        Yields:
+            Dictionaries representing Cytoscape elements.
+        """
+
     def to_cytoscape_elements(self) -> list[dict[str, Any]]:
         """Convert to Cytoscape elements (nodes and edges).
 
         Returns:
             List of dictionaries representing Cytoscape elements.
         """
+        return list(self.iter_cytoscape_elements())
+
+    def emit_json(self) -> bytes:
+        """Serialize the Cytoscape elements to compact UTF-8 JSON.
+
+        Returns:
+            JSON array of the elements, encoded as UTF-8.
+        """
+        return _JSON_ENCODER.encode(self.to_cytoscape_elements()).encode()
+
+    @staticmethod
+    def bulk_to_cytoscape_elements(
+        associations: Iterable[BaseAssociation],
+    ) -> list[dict[str, Any]]:
+        """Convert many associations to Cytoscape elements, emitting each ID once.
+
+        Associations that share a gene, protein, process, object, chemical or
+        organ produce the same node ID, and associations that share a gene and
+        protein produce the same edge ID. Cytoscape.js rejects repeated IDs, so
+        only the first node or edge with each ID is kept; elements otherwise
+        keep the order in which the associations emit them.
+
+        Args:
+            associations: Associations to convert.
+
+        Returns:
+            List of dictionaries representing Cytoscape elements.
+        """
+        elements: list[dict[str, Any]] = []
+        seen_ids: set[str] = set()
+        for association in associations:
+            for element in association.iter_cytoscape_elements():
+                element_id = element["data"].get("id")
+                if element_id in seen_ids:
+                    continue
+                seen_ids.add(element_id)
+                elements.append(element)
+        return elements
 
     @classmethod
     @abstractmethod
@@ -44,95 +596,94 @@ class BaseAssociation(ABC):
             List of association objects.
         """
 
-    def get_nodes(self) -> list[CytoscapeNode]:
-        """Extract nodes from cytoscape elements.
+    def to_cytoscape(self) -> tuple[list[CytoscapeNode], list[CytoscapeEdge]]:
+        """Convert to Cytoscape node and edge objects in a single pass.
+
+        The objects are resolved against the global node registry on every
+        call, so they are never stale after ``CytoscapeNode.clear_registry``.
 
         Returns:
-            List of CytoscapeNode objects.
+            Tuple of CytoscapeNode and CytoscapeEdge lists.
         """
-        elements = self.to_cytoscape_elements()
-        nodes = []
-        for element in elements:
-            if element.get("group") != "edges" and "data" in element:
-                data = element["data"]
-                if "source" not in data and "target" not in data:
-                    node = CytoscapeNode(
-                        id=data.get("id", ""),
-                        label=data.get("label", ""),
-                        node_type=data.get("type", ""),
-                        classes=element.get("classes", ""),
-                        properties=data,
+        nodes: list[CytoscapeNode] = []
+        edges: list[CytoscapeEdge] = []
+        # Elements built in this module always carry data and never a group key
+        for element in self.iter_cytoscape_elements():
+            data = element["data"]
+            if "source" in data:
+                if "target" in data:  # It's an edge
+                    # Positional arguments: id, source, target, label, properties
+                    edges.append(
+                        CytoscapeEdge(
+                            data.get("id", ""),
+                            data["source"],
+                            data["target"],
+                            data.get("label", ""),
+                            data,
+                        )
+                    )
+            elif "target" not in data:
+                # Positional arguments: id, label, node_type, classes, properties
+                nodes.append(
+                    CytoscapeNode(
+                        data.get("id", ""),
+                        data.get("label", ""),
+                        data.get("type", ""),
+                        element.get("classes", ""),
+                        data,
                     )
-                    nodes.append(node)
-        return nodes
+                )
+        return nodes, edges
 
-    def get_edges(self) -> list[CytoscapeEdge]:
-        """Extract edges from cytoscape elements.
+    def get_nodes_and_edges(self) -> tuple[list[CytoscapeNode], list[CytoscapeEdge]]:
+        """Extract both nodes and edges from cytoscape elements.
 
         Returns:
-            List of CytoscapeEdge objects.
+            Tuple of CytoscapeNode and CytoscapeEdge lists.
         """
-        elements = self.to_cytoscape_elements()
-        edges = []
-        for element in elements:
-            if element.get("group") == "edges" or (
-                "data" in element and "source" in element["data"]
-            ):
-                data = element["data"]
-                if "source" in data and "target" in data:  # It's an edge
-                    edge = CytoscapeEdge(
-                        id=data.get("id", ""),
-                        source=data.get("source", ""),
-                        target=data.get("target", ""),
-                        label=data.get("label", ""),
-                        properties=data,
-                    )
-                    edges.append(edge)
-        return edges
+        return self.to_cytoscape()
 
-    @staticmethod
-    def _collect_nodes_by_type(
-        elements: list[dict[str, Any]], node_types: list[str]
-    ) -> dict[str, dict[str, Any]]:
-        """Collect nodes of specific types from elements.
+    def get_nodes(self) -> list[CytoscapeNode]:
+        """Extract nodes from cytoscape elements.
 
-        Args:
-            elements: List of Cytoscape elements.
-            node_types: List of node types to collect.
+        Returns:
+            List of CytoscapeNode objects.
+        """
+        return self.to_cytoscape()[0]
+
+    def get_edges(self) -> list[CytoscapeEdge]:
+        """Extract edges from cytoscape elements.
 
         Returns:
-            Dictionary of node IDs to node data.
+            List of CytoscapeEdge objects.
         """
-        nodes = {}
-        for element in elements:
-            if element.get("group") != "edges" and "data" in element:
-                data = element["data"]
-                if data.get("type") in node_types:
-                    nodes[data.get("id")] = data
-        return nodes
+        return self.to_cytoscape()[1]
 
     @staticmethod
-    def _collect_edges_by_type(
-        elements: list[dict[str, Any]], edge_types: list[str]
-    ) -> list[dict[str, Any]]:
-        """Collect edges of specific types from elements.
+    def _partition_elements(
+        elements: list[dict[str, Any]],
+    ) -> tuple[dict[str, dict[str, dict[str, Any]]], dict[str, list[dict[str, Any]]]]:
+        """Bucket node and edge data by type in a single pass over elements.
 
         Args:
             elements: List of Cytoscape elements.
-            edge_types: List of edge types to collect.
 
         Returns:
-            List of edge data dictionaries.
+            Tuple of node data keyed by type then node ID, and edge data
+            lists keyed by type.
         """
-        edges = []
+        nodes_by_type: dict[str, dict[str, dict[str, Any]]] = defaultdict(dict)
+        edges_by_type: dict[str, list[dict[str, Any]]] = defaultdict(list)
         for element in elements:
-            if element.get("group") == "edges" or (
-                "data" in element and "source" in element["data"]
-            ):
-                data = element["data"]
-                if data.get("type") in edge_types:
-                    edges.append(data)
-        return edges
+            data = element.get("data")
+            if data is None:
+                continue
+            # Every edge built in this module carries a source, so test that first
+            if "source" in data or element.get("group") == "edges":
+                edges_by_type[data.get("type")].append(data)
+            else:
+                nodes_by_type[data.get("type")][data.get("id")] = data
+        return nodes_by_type, edges_by_type
 
     @staticmethod
     def _is_ke_uri(uri: str) -> bool:
@@ -144,10 +695,10 @@ class BaseAssociation(ABC):
         Returns:
             True if Key Event URI, False otherwise.
         """
-        return uri.startswith("https://identifiers.org/aop.events/")
+        return uri.startswith(_KE_URI_PREFIX)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class GeneAssociation(BaseAssociation):
     """Represent gene associations with Key Events."""
 
@@ -160,84 +711,103 @@ class GeneAssociation(BaseAssociation):
         if not self.ke_uri or not self.gene_id:
             raise ValueError("KE URI and gene ID are required")
 
-    def to_cytoscape_elements(self) -> list[dict[str, Any]]:
-        """Convert to Cytoscape elements (nodes and edges).
+    @classmethod
+    def _trusted(cls, ke_uri: str, gene_id: str, protein_id: str | None = None) -> GeneAssociation:
+        """Create an instance without running ``__init__`` and its validation.
+
+        Only for callers that have already checked the KE URI and gene ID.
+
+        Args:
+            ke_uri: Key Event URI, must be non-empty.
+            gene_id: Gene ID, must be non-empty.
+            protein_id: Protein ID, if any.
 
         Returns:
-            List of dictionaries representing Cytoscape elements.
+            GeneAssociation object.
         """
-        elements = []
-
-        # Gene node
-        gene_node_id = f"gene_{self.gene_id}"
-        elements.append(
-            {
-                "data": {
-                    "id": gene_node_id,
-                    "label": self.gene_id,
-                    "type": NodeType.GENE.value,
-                    "gene_id": self.gene_id,
-                },
-                "classes": "gene-node",
-            }
-        )
+        association = object.__new__(cls)
+        object.__setattr__(association, "ke_uri", ke_uri)
+        object.__setattr__(association, "gene_id", gene_id)
+        object.__setattr__(association, "protein_id", protein_id)
+        return association
+
+    def _natural_key(self) -> tuple[Any, ...]:
+        """Get the KE URI, gene ID and protein ID identifying this association.
+
+        Returns:
+            Tuple of identifying field values.
+        """
+        return (self.ke_uri, self.gene_id, self.protein_id)
 
-        # Protein node and relationships (only if proteins are included)
-        if self.protein_id and self.protein_id != "NA":
-            protein_node_id = f"protein_{self.protein_id}"
-            elements.append(
-                {
-                    "data": {
-                        "id": protein_node_id,
-                        "label": self.protein_id,
-                        "type": NodeType.PROTEIN.value,
-                        "protein_id": self.protein_id,
-                    },
-                    "classes": "protein-node",
-                }
-            )
-
-            # Translates to edge
-            elements.append(
-                {
-                    "data": {
-                        "id": f"{gene_node_id}_{protein_node_id}",
-                        "source": gene_node_id,
-                        "target": protein_node_id,
-                        "label": "translates to",
-                        "type": EdgeType.TRANSLATES_TO.value,
-                    }
-                }
-            )
-
-            # Part of edge (protein to KE)
-            elements.append(
-                {
-                    "data": {
-                        "id": f"{protein_node_id}_{self.ke_uri}",
-                        "source": protein_node_id,
-                        "target": self.ke_uri,
-                        "label": "part of",
-                        "type": EdgeType.PART_OF.value,
-                    }
-                }
-            )
-        else:
-            # Direct gene to KE connection when no protein is included
-            elements.append(
-                {
-                    "data": {
-                        "id": f"{gene_node_id}_{self.ke_uri}",
-                        "source": gene_node_id,
-                        "target": self.ke_uri,
-                        "label": "part of",
-                        "type": EdgeType.PART_OF.value,
-                    }
-                }
-            )
+    def iter_cytoscape_elements(self) -> Iterator[dict[str, Any]]:
+        """Iterate over Cytoscape elements (nodes and edges) one at a time.
 
+        Yields:
+            Dictionaries representing Cytoscape elements.
+        """
+        yield from _iter_gene_elements(self.ke_uri, self.gene_id, self.protein_id)
+
+    @classmethod
+    def to_cytoscape_elements_bulk(
+        cls,
+        ke_uris: Sequence[str],
+        gene_ids: Sequence[str],
+        protein_ids: Sequence[str | None],
+    ) -> list[dict[str, Any]]:
+        """Convert columns of gene association fields to Cytoscape elements.
+
+        Equivalent to concatenating ``to_cytoscape_elements`` of one
+        association per row, without creating the association objects.
+
+        Args:
+            ke_uris: Key Event URIs.
+            gene_ids: Gene IDs.
+            protein_ids: Protein IDs, ``None`` where absent.
+
+        Returns:
+            List of dictionaries representing Cytoscape elements.
+        """
+        elements: list[dict[str, Any]] = []
+        extend = elements.extend
+        for ke_uri, gene_id, protein_id in zip(ke_uris, gene_ids, protein_ids, strict=True):
+            if not ke_uri or not gene_id:
+                raise ValueError("KE URI and gene ID are required")
+            extend(_iter_gene_elements(ke_uri, gene_id, protein_id))
         return elements
 
+    @staticmethod
+    def _map_proteins_to_genes(
+        gene_nodes: dict[str, dict[str, Any]],
+        protein_nodes: dict[str, dict[str, Any]],
+        translates_to_edges: list[dict[str, Any]],
+    ) -> dict[str, str]:
+        """Map protein IDs to the gene IDs that translate to them.
+
+        Args:
+            gene_nodes: Gene node data keyed by node ID.
+            protein_nodes: Protein node data keyed by node ID.
+            translates_to_edges: Translates-to edge data.
+
+        Returns:
+            Dictionary mapping each protein ID to the first gene translating to it.
+        """
+        # Build gene->protein mapping
+        gene_to_protein = {}
+        for edge in translates_to_edges:
+            gene_data = gene_nodes.get(edge.get("source", ""))
+            if gene_data is None:
+                continue
+            protein_data = protein_nodes.get(edge.get("target", ""))
+            if protein_data is not None:
+                gene_id = _value_or(gene_data, "gene_id", "label")
+                gene_to_protein[gene_id] = _value_or(protein_data, "protein_id", "label")
+
+        # Invert once so protein -> gene lookups are O(1); keep the first gene per protein
+        protein_to_gene: dict[str, str] = {}
+        for gene_id, protein_id in gene_to_protein.items():
+            protein_to_gene.setdefault(protein_id, gene_id)
+        return protein_to_gene
+
     @classmethod
     def from_cytoscape_elements(cls, elements: list[dict[str, Any]]) -> Sequence[BaseAssociation]:
         """Parse Cytoscape elements back into GeneAssociation objects.
@@ -250,57 +820,50 @@ class GeneAssociation(BaseAssociation):
         """
         associations = []
 
+        nodes_by_type, edges_by_type = cls._partition_elements(elements)
+
         # Collect relevant nodes
-        gene_nodes = cls._collect_nodes_by_type(elements, [NodeType.GENE.value])
-        protein_nodes = cls._collect_nodes_by_type(elements, [NodeType.PROTEIN.value])
+        gene_nodes = nodes_by_type.get(_GENE_TYPE, {})
+        protein_nodes = nodes_by_type.get(_PROTEIN_TYPE, {})
 
         # Collect part_of edges
-        part_of_edges = cls._collect_edges_by_type(elements, [EdgeType.PART_OF.value])
-        translates_to_edges = cls._collect_edges_by_type(elements, [EdgeType.TRANSLATES_TO.value])
+        part_of_edges = edges_by_type.get(_PART_OF_TYPE, [])
+        translates_to_edges = edges_by_type.get(_TRANSLATES_TO_TYPE, [])
 
-        # Build gene->protein mapping
-        gene_to_protein = {}
-        for edge in translates_to_edges:
-            source_id = edge.get("source", "")
-            target_id = edge.get("target", "")
-            if source_id in gene_nodes and target_id in protein_nodes:
-                gene_id = gene_nodes[source_id].get(
-                    "gene_id", gene_nodes[source_id].get("label", "")
-                )
-                protein_id = protein_nodes[target_id].get(
-                    "protein_id", protein_nodes[target_id].get("label", "")
-                )
-                gene_to_protein[gene_id] = protein_id
+        protein_to_gene = cls._map_proteins_to_genes(gene_nodes, protein_nodes, translates_to_edges)
 
         # Process part_of edges
+        ke_prefix = _KE_URI_PREFIX
+        seen: set[tuple[str, str, str | None]] = set()  # (gene_id, ke_uri, protein_id)
         for edge in part_of_edges:
-            source_id = edge.get("source", "")
             target_uri = edge.get("target", "")
+            if not target_uri.startswith(ke_prefix):
+                continue
+            source_id = edge.get("source", "")
 
-            if cls._is_ke_uri(target_uri):
-                # Direct gene -> KE
-                if source_id in gene_nodes:
-                    gene_id = gene_nodes[source_id].get(
-                        "gene_id", gene_nodes[source_id].get("label", "")
-                    )
+            # Direct gene -> KE
+            if source_id in gene_nodes:
+                gene_id = _value_or(gene_nodes[source_id], "gene_id", "label")
+                key = (gene_id, target_uri, None)
+                if key not in seen:
+                    seen.add(key)
                     associations.append(cls(ke_uri=target_uri, gene_id=gene_id, protein_id=None))
 
-                # Protein -> KE (find corresponding gene)
-                elif source_id in protein_nodes:
-                    protein_id = protein_nodes[source_id].get(
-                        "protein_id", protein_nodes[source_id].get("label", "")
+            # Protein -> KE (find corresponding gene)
+            elif source_id in protein_nodes:
+                protein_id = _value_or(protein_nodes[source_id], "protein_id", "label")
+                # Find gene that translates to this protein
+                gene_id = protein_to_gene.get(protein_id)
+                if gene_id and (gene_id, target_uri, protein_id) not in seen:
+                    seen.add((gene_id, target_uri, protein_id))
+                    associations.append(
+                        cls(ke_uri=target_uri, gene_id=gene_id, protein_id=protein_id)
                     )
-                    # Find gene that translates to this protein
-                    gene_id = next((g for g, p in gene_to_protein.items() if p == protein_id), None)
-                    if gene_id:
-                        associations.append(
-                            cls(ke_uri=target_uri, gene_id=gene_id, protein_id=protein_id)
-                        )
 
         return associations
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class ComponentAssociation(BaseAssociation):
     """Represent component associations with KEs."""
 
@@ -312,118 +875,88 @@ class ComponentAssociation(BaseAssociation):
     object_name: str
     action: str
     object_type: str
+    TABLE_COLUMNS: ClassVar[tuple[str, ...]] = (
+        "ke_id",
+        "ke_uri",
+        "ke_label",
+        "process_id",
+        "process_name",
+        "process_iri",
+        "object_id",
+        "object_name",
+        "object_iri",
+        "action",
+        "node_id",
+    )
+    _ke_id: str = field(default="", init=False, repr=False, compare=False)
+    _process_id: str = field(default="", init=False, repr=False, compare=False)
+    _object_id: str = field(default="", init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Perform basic validation after initialization."""
         if not self.ke_uri or not self.process:
             raise ValueError("KE URI and process are required")
+        # Parsed once, shared by the element and table conversions
+        object.__setattr__(self, "_ke_id", _uri_tail(self.ke_uri))
+        object.__setattr__(self, "_process_id", _uri_tail(self.process))
+        object.__setattr__(self, "_object_id", _uri_tail(self.object))
 
-    def to_cytoscape_elements(self) -> list[dict[str, Any]]:
-        """Convert to Cytoscape elements (nodes and edges).
+    def _natural_key(self) -> tuple[Any, ...]:
+        """Get the KE, process, object and action fields identifying this association.
 
         Returns:
-            List of dictionaries representing Cytoscape elements.
+            Tuple of identifying field values.
         """
-        if not self.process:  # DROP components with empty process IRI
-            return []
-        ke = "aop.events_" + self.ke_uri.split("/")[-1]
-        process = self.process.split("/")[-1] if "/" in self.process else self.process
-        object_n = self.object.split("/")[-1] if "/" in self.object else self.object
-        elements = []
-        process_node_id = f"process_{process}"
-
-        elements.append(
-            {
-                "data": {
-                    "id": process_node_id,
-                    "label": self.process_name,
-                    "type": NodeType.COMP_PROC.value,
-                    "process_iri": self.process,
-                    "process_name": self.process_name,
-                    "process_id": process,
-                },
-                "classes": NodeType.COMP_PROC.value,
-            }
+        return (
+            self.ke_uri,
+            self.ke_name,
+            self.process,
+            self.process_name,
+            self.object,
+            self.object_name,
+            self.action,
+            self.object_type,
         )
 
-        # Determine edge label
-        edge_label = (
-            self.action
-            if self.action in EdgeType.get_component_actions()
-            else EdgeType.HAS_PROCESS.value
-        )
-        edge_type = EdgeType.HAS_PROCESS.value
-
-        # KE -> Process edge (action)
-        elements.append(
-            {
-                "data": {
-                    "id": f"{ke}_{process_node_id}",
-                    "source": self.ke_uri,
-                    "target": process_node_id,
-                    "label": edge_label,
-                    "type": edge_type,
-                }
-            }
+    def iter_cytoscape_elements(self) -> Iterator[dict[str, Any]]:
+        """Iterate over Cytoscape elements (nodes and edges) one at a time.
+
+        Yields:
+            Dictionaries representing Cytoscape elements.
+        """
+        yield from _iter_component_elements_from_ids(
+            self.ke_uri,
+            self._ke_id,
+            self.process,
+            self._process_id,
+            self.process_name,
+            self.object,
+            self._object_id,
+            self.object_name,
+            self.action,
+            self.object_type,
         )
 
-        if self.object:
-            object_node_id = f"object_{object_n}"
-
-            # Determine the type based on object_type or object_iri
-            # Hacky patch for misassigned types in AOP WIKI RDF
-            if self.object_type == "http://aopkb.org/aop_ontology#OrganContext" or any(
-                substring in object_n for substring in ["FMA", "UBERON"]
-            ):
-                object_node_type = NodeType.ORGAN.value
-                obj_cls = f"{NodeType.ORGAN.value} {NodeType.COMP_OBJ.value}"
-            elif (
-                "CellTypeContext" in self.object_type
-                or any(substring in object_n for substring in ["CL", "EFO"])
-                or self.object_name in ["cell", "mitochondrion"]
-            ):
-                object_node_type = NodeType.CELL.value
-                obj_cls = f"{NodeType.CELL.value} {NodeType.COMP_OBJ.value}"
-            elif self.object.endswith("PATO_0001241") or any(
-                substring in object_n for substring in ["PR"]
-            ):
-                object_node_type = NodeType.PROTEIN.value
-                obj_cls = f"{NodeType.PROTEIN.value} {NodeType.COMP_OBJ.value}"
-            elif any(substring in object_n for substring in ["GO"]):
-                object_node_type = NodeType.CELL_COMP.value
-                obj_cls = f"{NodeType.CELL_COMP.value} {NodeType.COMP_OBJ.value}"
-            else:
-                # Default to component object type
-                object_node_type = NodeType.COMP_OBJ.value
-                obj_cls = f"{NodeType.COMP_OBJ.value}"
-
-            elements.append(
-                {
-                    "data": {
-                        "id": object_node_id,
-                        "label": self.object_name,
-                        "type": object_node_type,
-                        "object_iri": self.object,
-                        "object_name": self.object_name,
-                        "object_id": object_n,
-                    },
-                    "classes": obj_cls,
-                }
-            )
-
-            # NEW: KE -> Object edge instead of Process -> Object
-            elements.append(
-                {
-                    "data": {
-                        "id": f"{ke}_{object_node_id}",
-                        "source": self.ke_uri,
-                        "target": object_node_id,
-                        "label": EdgeType.INVOLVES.value,
-                        "type": EdgeType.INVOLVES.value,
-                    }
-                }
-            )
-        return elements
+    def to_table_row(self) -> tuple[str, ...]:
+        """Convert to a component table row ordered as ``TABLE_COLUMNS``.
+
+        Returns:
+            Tuple of table cell values.
+        """
+        process_id = self._process_id
+        return (
+            self._ke_id,
+            self.ke_uri,
+            self.ke_name if self.ke_name else "N/A",
+            process_id,
+            self.process_name,
+            self.process,
+            self._object_id if self.object else "N/A",
+            self.object_name if self.object_name else "N/A",
+            self.object if self.object else "N/A",
+            self.action if self.action else "N/A",
+            f"process_{process_id}",
+        )
 
     def to_table_entry(self) -> dict[str, str]:
         """Convert to component table entry format.
@@ -431,27 +964,52 @@ class ComponentAssociation(BaseAssociation):
         Returns:
             Dictionary representing a component table entry.
         """
-        # Extract KE ID from URI
-        ke_id = self.ke_uri.split("/")[-1] if "/" in self.ke_uri else self.ke_uri
-        # Extract process ID from URI
-        process_id = self.process.split("/")[-1] if "/" in self.process else self.process
-
-        # Extract object ID from URI
-        object_id = self.object.split("/")[-1] if "/" in self.object else self.object
-
-        return {
-            "ke_id": ke_id,
-            "ke_uri": self.ke_uri,
-            "ke_label": self.ke_name if self.ke_name else "N/A",
-            "process_id": process_id,
-            "process_name": self.process_name,
-            "process_iri": self.process,
-            "object_id": object_id if self.object else "N/A",
-            "object_name": self.object_name if self.object_name else "N/A",
-            "object_iri": self.object if self.object else "N/A",
-            "action": self.action if self.action else "N/A",
-            "node_id": f"process_{process_id}",
-        }
+        return dict(zip(self.TABLE_COLUMNS, self.to_table_row(), strict=True))
+
+    @classmethod
+    def to_cytoscape_elements_bulk(
+        cls,
+        ke_uris: Sequence[str],
+        processes: Sequence[str],
+        process_names: Sequence[str],
+        objects: Sequence[str],
+        object_names: Sequence[str],
+        actions: Sequence[str],
+        object_types: Sequence[str],
+    ) -> list[dict[str, Any]]:
+        """Convert columns of component association fields to Cytoscape elements.
+
+        Equivalent to concatenating ``to_cytoscape_elements`` of one
+        association per row, without creating the association objects.
+
+        Args:
+            ke_uris: Key Event URIs.
+            processes: Process IRIs.
+            process_names: Process names.
+            objects: Object IRIs.
+            object_names: Object names.
+            actions: Action labels.
+            object_types: Object type IRIs.
+
+        Returns:
+            List of dictionaries representing Cytoscape elements.
+        """
+        elements: list[dict[str, Any]] = []
+        extend = elements.extend
+        for row in zip(
+            ke_uris,
+            processes,
+            process_names,
+            objects,
+            object_names,
+            actions,
+            object_types,
+            strict=True,
+        ):
+            if not row[0] or not row[1]:
+                raise ValueError("KE URI and process are required")
+            extend(_iter_component_elements(*row))
+        return elements
 
     @classmethod
     def from_cytoscape_elements(cls, elements: list[dict[str, Any]]) -> Sequence[BaseAssociation]:
@@ -465,36 +1023,43 @@ class ComponentAssociation(BaseAssociation):
         """
         associations = []
 
+        nodes_by_type, edges_by_type = cls._partition_elements(elements)
+
         # Collect relevant nodes
-        process_nodes = cls._collect_nodes_by_type(elements, [NodeType.COMP_PROC.value])
-        object_node_types = [
-            NodeType.COMP_OBJ.value,
-            NodeType.ORGAN.value,
-            NodeType.CELL.value,
-            NodeType.PROTEIN.value,
-            NodeType.CELL_COMP.value,
-        ]
-        object_nodes = cls._collect_nodes_by_type(elements, object_node_types)
+        process_nodes = nodes_by_type.get(_COMP_PROC_TYPE, {})
+        object_nodes: dict[str, dict[str, Any]] = {}
+        for object_node_type in _COMP_OBJECT_NODE_TYPES:
+            if object_node_type in nodes_by_type:
+                object_nodes.update(nodes_by_type[object_node_type])
 
         # Collect relevant edges
-        has_process_edges = cls._collect_edges_by_type(elements, [EdgeType.HAS_PROCESS.value])
-        involves_edges = cls._collect_edges_by_type(elements, [EdgeType.INVOLVES.value])
+        has_process_edges = edges_by_type.get(_HAS_PROCESS_TYPE, [])
+        involves_edges = edges_by_type.get(_INVOLVES_TYPE, [])
 
         # Build KE -> object mapping
+        ke_prefix = _KE_URI_PREFIX
         ke_to_object = {}
         for edge in involves_edges:
             source_uri = edge.get("source", "")
-            target_id = edge.get("target", "")
-            if cls._is_ke_uri(source_uri) and target_id in object_nodes:
-                ke_to_object[source_uri] = object_nodes[target_id]
-
-        # Process has_process edges
+            if not source_uri.startswith(ke_prefix):
+                continue
+            object_data = object_nodes.get(edge.get("target", ""))
+            if object_data is not None:
+                ke_to_object[source_uri] = object_data
+
+        # Process has_process edges, once per KE, process and action
+        seen: set[tuple[str, str, str]] = set()
         for edge in has_process_edges:
             source_uri = edge.get("source", "")
+            if not source_uri.startswith(ke_prefix):
+                continue
             target_id = edge.get("target", "")
-
-            if cls._is_ke_uri(source_uri) and target_id in process_nodes:
-                process_data = process_nodes[target_id]
+            key = (source_uri, target_id, edge.get("label", ""))
+            if key in seen:
+                continue
+            seen.add(key)
+            process_data = process_nodes.get(target_id)
+            if process_data is not None:
                 object_data = ke_to_object.get(source_uri, {})
 
                 associations.append(
@@ -502,11 +1067,9 @@ class ComponentAssociation(BaseAssociation):
                         ke_uri=source_uri,
                         ke_name="",
                         process=process_data.get("process_iri", ""),
-                        process_name=process_data.get(
-                            "process_name", process_data.get("label", "")
-                        ),
+                        process_name=_value_or(process_data, "process_name", "label"),
                         object=object_data.get("object_iri", ""),
-                        object_name=object_data.get("object_name", object_data.get("label", "")),
+                        object_name=_value_or(object_data, "object_name", "label"),
                         action=edge.get("label", ""),
                         object_type=object_data.get("type", ""),
                     )
@@ -515,7 +1078,7 @@ class ComponentAssociation(BaseAssociation):
         return associations
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class CompoundAssociation(BaseAssociation):
     """Represent compound associations with AOPs."""
 
@@ -526,62 +1089,76 @@ class CompoundAssociation(BaseAssociation):
     pubchem_compound: str
     compound_name: str
     cas_id: str | None = None
+    TABLE_COLUMNS: ClassVar[tuple[str, ...]] = (
+        "compound_name",
+        "chemical_label",
+        "pubchem_id",
+        "pubchem_compound",
+        "cas_id",
+        "aop_id",
+        "aop_uri",
+        "mie_uri",
+        "chemical_uri",
+    )
+    _pubchem_id: str = field(default="", init=False, repr=False, compare=False)
+    _aop_id: str = field(default="", init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Perform basic validation after initialization."""
         if not self.aop_uri or not self.chemical_uri:
             raise ValueError("AOP URI and chemical URI are required")
+        object.__setattr__(self, "_pubchem_id", _uri_tail(self.pubchem_compound))
+        object.__setattr__(self, "_aop_id", _uri_tail(self.aop_uri))
 
-    def to_cytoscape_elements(self) -> list[dict[str, Any]]:
-        """Convert to Cytoscape elements (nodes and edges).
+    def _natural_key(self) -> tuple[Any, ...]:
+        """Get the AOP, MIE, chemical and compound fields identifying this association.
 
         Returns:
-            List of dictionaries representing Cytoscape elements.
+            Tuple of identifying field values.
         """
-        elements = []
-
-        # Extract identifiers
-        pubchem_id = (
-            self.pubchem_compound.split("/")[-1]
-            if "/" in self.pubchem_compound
-            else self.pubchem_compound
+        return (
+            self.aop_uri,
+            self.mie_uri,
+            self.chemical_uri,
+            self.chemical_label,
+            self.pubchem_compound,
+            self.compound_name,
+            self.cas_id,
         )
-        chemical_node_id = f"chemical_{pubchem_id}"
-
-        # Chemical node - include aop_uri and chemical_uri for back-parsing
-        elements.append(
-            {
-                "data": {
-                    "id": chemical_node_id,
-                    "label": self.compound_name or self.chemical_label,
-                    "type": NodeType.CHEMICAL.value,
-                    "pubchem_id": pubchem_id,
-                    "cas_id": self.cas_id,
-                    "chemical_label": self.chemical_label,
-                    "compound_name": self.compound_name,
-                    "pubchem_compound": self.pubchem_compound,
-                    "aop_uri": self.aop_uri,
-                    "chemical_uri": self.chemical_uri,
-                },
-                "classes": "chemical-node",
-            }
+
+    def iter_cytoscape_elements(self) -> Iterator[dict[str, Any]]:
+        """Iterate over Cytoscape elements (nodes and edges) one at a time.
+
+        Yields:
+            Dictionaries representing Cytoscape elements.
+        """
+        yield from _iter_compound_elements(
+            self.aop_uri,
+            self.mie_uri,
+            self.chemical_uri,
+            self.chemical_label,
+            self.pubchem_compound,
+            self.compound_name,
+            self.cas_id,
         )
 
-        # Edge from chemical to MIE
-        if self.mie_uri:
-            elements.append(
-                {
-                    "data": {
-                        "id": f"{chemical_node_id}_{self.mie_uri}",
-                        "source": chemical_node_id,
-                        "target": self.mie_uri,
-                        "label": EdgeType.IS_STRESSOR_OF.value,
-                        "type": EdgeType.IS_STRESSOR_OF.value,
-                    }
-                }
-            )
+    def to_table_row(self) -> tuple[str, ...]:
+        """Convert to a compound table row ordered as ``TABLE_COLUMNS``.
 
-        return elements
+        Returns:
+            Tuple of table cell values.
+        """
+        return (
+            self.compound_name or self.chemical_label,
+            self.chemical_label,
+            self._pubchem_id,
+            self.pubchem_compound,
+            self.cas_id if self.cas_id else "N/A",
+            f"AOP:{self._aop_id}",
+            self.aop_uri,
+            self.mie_uri,
+            self.chemical_uri,
+        )
 
     def to_table_entry(self) -> dict[str, str]:
         """Convert to compound table entry format.
@@ -589,27 +1166,52 @@ class CompoundAssociation(BaseAssociation):
         Returns:
             Dictionary representing a compound table entry.
         """
-        # Extract PubChem ID from compound URI
-        pubchem_id = (
-            self.pubchem_compound.split("/")[-1]
-            if "/" in self.pubchem_compound
-            else self.pubchem_compound
-        )
+        return dict(zip(self.TABLE_COLUMNS, self.to_table_row(), strict=True))
 
-        # Extract AOP ID from URI
-        aop_id = self.aop_uri.split("/")[-1] if "/" in self.aop_uri else self.aop_uri
-
-        return {
-            "compound_name": self.compound_name or self.chemical_label,
-            "chemical_label": self.chemical_label,
-            "pubchem_id": pubchem_id,
-            "pubchem_compound": self.pubchem_compound,
-            "cas_id": self.cas_id if self.cas_id else "N/A",
-            "aop_id": f"AOP:{aop_id}",
-            "aop_uri": self.aop_uri,
-            "mie_uri": self.mie_uri,
-            "chemical_uri": self.chemical_uri,
-        }
+    @classmethod
+    def to_cytoscape_elements_bulk(
+        cls,
+        aop_uris: Sequence[str],
+        mie_uris: Sequence[str],
+        chemical_uris: Sequence[str],
+        chemical_labels: Sequence[str],
+        pubchem_compounds: Sequence[str],
+        compound_names: Sequence[str],
+        cas_ids: Sequence[str | None],
+    ) -> list[dict[str, Any]]:
+        """Convert columns of compound association fields to Cytoscape elements.
+
+        Equivalent to concatenating ``to_cytoscape_elements`` of one
+        association per row, without creating the association objects.
+
+        Args:
+            aop_uris: AOP URIs.
+            mie_uris: MIE URIs.
+            chemical_uris: Chemical URIs.
+            chemical_labels: Chemical labels.
+            pubchem_compounds: PubChem compound URIs.
+            compound_names: Compound names.
+            cas_ids: CAS IDs, ``None`` where absent.
+
+        Returns:
+            List of dictionaries representing Cytoscape elements.
+        """
+        elements: list[dict[str, Any]] = []
+        extend = elements.extend
+        for row in zip(
+            aop_uris,
+            mie_uris,
+            chemical_uris,
+            chemical_labels,
+            pubchem_compounds,
+            compound_names,
+            cas_ids,
+            strict=True,
+        ):
+            if not row[0] or not row[2]:
+                raise ValueError("AOP URI and chemical URI are required")
+            extend(_iter_compound_elements(*row))
+        return elements
 
     @classmethod
     def from_cytoscape_elements(cls, elements: list[dict[str, Any]]) -> Sequence[BaseAssociation]:
@@ -624,17 +1226,18 @@ class CompoundAssociation(BaseAssociation):
         associations = []
 
         # Collect chemical nodes and stressor edges
-        chemical_nodes = cls._collect_nodes_by_type(elements, [NodeType.CHEMICAL.value])
-        stressor_edges = cls._collect_edges_by_type(elements, [EdgeType.IS_STRESSOR_OF.value])
+        nodes_by_type, edges_by_type = cls._partition_elements(elements)
+        chemical_nodes = nodes_by_type.get(_CHEMICAL_TYPE, {})
+        stressor_edges = edges_by_type.get(_IS_STRESSOR_OF_TYPE, [])
 
         # Process stressor relationships
+        ke_prefix = _KE_URI_PREFIX
         for edge in stressor_edges:
-            source_id = edge.get("source", "")
+            chem_data = chemical_nodes.get(edge.get("source", ""))
+            if chem_data is None:
+                continue
             target_uri = edge.get("target", "")
-
-            if source_id in chemical_nodes and cls._is_ke_uri(target_uri):
-                chem_data = chemical_nodes[source_id]
-
+            if target_uri.startswith(ke_prefix):
                 # Get the required URIs from the chemical node data
                 aop_uri = chem_data.get("aop_uri", "")
                 chemical_uri = chem_data.get("chemical_uri", "")
@@ -646,13 +1249,9 @@ class CompoundAssociation(BaseAssociation):
                             aop_uri=aop_uri,
                             mie_uri=target_uri,
                             chemical_uri=chemical_uri,
-                            chemical_label=chem_data.get(
-                                "chemical_label", chem_data.get("label", "")
-                            ),
+                            chemical_label=_value_or(chem_data, "chemical_label", "label"),
                             pubchem_compound=chem_data.get("pubchem_compound", ""),
-                            compound_name=chem_data.get(
-                                "compound_name", chem_data.get("label", "")
-                            ),
+                            compound_name=_value_or(chem_data, "compound_name", "label"),
                             cas_id=chem_data.get("cas_id"),
                         )
                     )
@@ -660,7 +1259,7 @@ class CompoundAssociation(BaseAssociation):
         return associations
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class GeneExpressionAssociation(BaseAssociation):
     """Represent gene expression associations with organs."""
 
@@ -673,54 +1272,65 @@ class GeneExpressionAssociation(BaseAssociation):
     developmental_id: str = ""
     developmental_stage_name: str = ""
     expr: str = ""
+    TABLE_COLUMNS: ClassVar[tuple[str, ...]] = (
+        "gene_id",
+        "organ",
+        "expression_level",
+        "confidence",
+        "developmental_stage",
+    )
 
     def __post_init__(self) -> None:
         """Perform basic validation after initialization."""
         if not self.gene_id or not self.anatomical_id:
             raise ValueError("Gene ID and anatomical ID are required")
 
-    def to_cytoscape_elements(self) -> list[dict[str, Any]]:
-        """Convert to Cytoscape elements (nodes and edges).
+    def _natural_key(self) -> tuple[Any, ...]:
+        """Get the gene, organ, expression, confidence and stage fields of this association.
 
         Returns:
-            List of dictionaries representing Cytoscape elements.
+            Tuple of identifying field values.
         """
-        elements = []
-
-        # Organ node
-        organ_node_id = f"{self.anatomical_id}"
-        elements.append(
-            {
-                "data": {
-                    "id": organ_node_id,
-                    "label": self.anatomical_name,
-                    "type": NodeType.ORGAN.value,
-                    "anatomical_id": self.anatomical_id,
-                    "anatomical_name": self.anatomical_name,
-                },
-                "classes": "organ-node",
-            }
+        return (
+            self.gene_id,
+            self.anatomical_id,
+            self.anatomical_name,
+            self.expression_level,
+            self.confidence_id,
+            self.confidence_level_name,
+            self.developmental_id,
+            self.developmental_stage_name,
+            self.expr,
         )
 
-        # Expression edge from gene to organ
-        gene_node_id = f"gene_{self.gene_id}"
-        expression_edge_id = f"{gene_node_id}_{organ_node_id}_expression"
-        elements.append(
-            {
-                "data": {
-                    "id": expression_edge_id,
-                    "source": gene_node_id,
-                    "target": organ_node_id,
-                    "label": f"expressed in ({self.expression_level})",
-                    "type": EdgeType.EXPRESSION_IN.value,
-                    "expression_level": self.expression_level,
-                    "confidence_level": self.confidence_level_name,
-                    "developmental_stage": self.developmental_stage_name,
-                }
-            }
+    def iter_cytoscape_elements(self) -> Iterator[dict[str, Any]]:
+        """Iterate over Cytoscape elements (nodes and edges) one at a time.
+
+        Yields:
+            Dictionaries representing Cytoscape elements.
+        """
+        yield from _iter_gene_expression_elements(
+            self.gene_id,
+            self.anatomical_id,
+            self.anatomical_name,
+            self.expression_level,
+            self.confidence_level_name,
+            self.developmental_stage_name,
         )
 
-        return elements
+    def to_table_row(self) -> tuple[str, ...]:
+        """Convert to a gene expression table row ordered as ``TABLE_COLUMNS``.
+
+        Returns:
+            Tuple of table cell values.
+        """
+        return (
+            self.gene_id,
+            self.anatomical_name,
+            self.expression_level,
+            self.confidence_level_name,
+            self.developmental_stage_name,
+        )
 
     def to_table_entry(self) -> dict[str, str]:
         """Convert to gene expression table entry format.
@@ -728,13 +1338,49 @@ class GeneExpressionAssociation(BaseAssociation):
         Returns:
             Dictionary representing a gene expression table entry.
         """
-        return {
-            "gene_id": self.gene_id,
-            "organ": self.anatomical_name,
-            "expression_level": self.expression_level,
-            "confidence": self.confidence_level_name,
-            "developmental_stage": self.developmental_stage_name,
-        }
+        return dict(zip(self.TABLE_COLUMNS, self.to_table_row(), strict=True))
+
+    @classmethod
+    def to_cytoscape_elements_bulk(
+        cls,
+        gene_ids: Sequence[str],
+        anatomical_ids: Sequence[str],
+        anatomical_names: Sequence[str],
+        expression_levels: Sequence[str],
+        confidence_level_names: Sequence[str],
+        developmental_stage_names: Sequence[str],
+    ) -> list[dict[str, Any]]:
+        """Convert columns of gene expression fields to Cytoscape elements.
+
+        Equivalent to concatenating ``to_cytoscape_elements`` of one
+        association per row, without creating the association objects.
+
+        Args:
+            gene_ids: Gene IDs.
+            anatomical_ids: Anatomical entity IDs.
+            anatomical_names: Anatomical entity names.
+            expression_levels: Expression levels.
+            confidence_level_names: Confidence level names.
+            developmental_stage_names: Developmental stage names.
+
+        Returns:
+            List of dictionaries representing Cytoscape elements.
+        """
+        elements: list[dict[str, Any]] = []
+        extend = elements.extend
+        for row in zip(
+            gene_ids,
+            anatomical_ids,
+            anatomical_names,
+            expression_levels,
+            confidence_level_names,
+            developmental_stage_names,
+            strict=True,
+        ):
+            if not row[0] or not row[1]:
+                raise ValueError("Gene ID and anatomical ID are required")
+            extend(_iter_gene_expression_elements(*row))
+        return elements
 
     @classmethod
     def from_cytoscape_elements(cls, elements: list[dict[str, Any]]) -> Sequence[BaseAssociation]:
@@ -748,26 +1394,23 @@ class GeneExpressionAssociation(BaseAssociation):
         associations = []
 
         # Collect nodes and edges
-        gene_nodes = cls._collect_nodes_by_type(elements, [NodeType.GENE.value])
-        organ_nodes = cls._collect_nodes_by_type(elements, [NodeType.ORGAN.value])
-        expression_edges = cls._collect_edges_by_type(elements, [EdgeType.EXPRESSION_IN.value])
+        nodes_by_type, edges_by_type = cls._partition_elements(elements)
+        gene_nodes = nodes_by_type.get(_GENE_TYPE, {})
+        organ_nodes = nodes_by_type.get(_ORGAN_TYPE, {})
+        expression_edges = edges_by_type.get(_EXPRESSION_IN_TYPE, [])
 
         # Process expression relationships
         for edge in expression_edges:
-            source_id = edge.get("source", "")
-            target_id = edge.get("target", "")
-
-            if source_id in gene_nodes and target_id in organ_nodes:
-                gene_data = gene_nodes[source_id]
-                organ_data = organ_nodes[target_id]
-
+            gene_data = gene_nodes.get(edge.get("source", ""))
+            if gene_data is None:
+                continue
+            organ_data = organ_nodes.get(edge.get("target", ""))
+            if organ_data is not None:
                 associations.append(
                     cls(
-                        gene_id=gene_data.get("gene_id", gene_data.get("label", "")),
-                        anatomical_id=organ_data.get("anatomical_id", organ_data.get("id", "")),
-                        anatomical_name=organ_data.get(
-                            "anatomical_name", organ_data.get("label", "")
-                        ),
+                        gene_id=_value_or(gene_data, "gene_id", "label"),
+                        anatomical_id=_value_or(organ_data, "anatomical_id", "id"),
+                        anatomical_name=_value_or(organ_data, "anatomical_name", "label"),
                         expression_level=edge.get("expression_level", ""),
                         confidence_level_name=edge.get("confidence_level", ""),
                         developmental_stage_name=edge.get("developmental_stage", ""),
@@ -777,7 +1420,7 @@ class GeneExpressionAssociation(BaseAssociation):
         return associations
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class OrganAssociation(BaseAssociation):
     """Represent an organ-key event association."""
 
@@ -790,13 +1433,22 @@ class OrganAssociation(BaseAssociation):
         if not self.ke_uri:
             raise ValueError("KE URI is required")
 
-    def to_cytoscape_elements(self) -> list[dict[str, Any]]:
-        """Convert to Cytoscape elements.
+    def _natural_key(self) -> tuple[Any, ...]:
+        """Get the KE URI and organ node and edge IDs identifying this association.
 
         Returns:
-            List of dictionaries representing Cytoscape elements.
+            Tuple of identifying field values.
+        """
+        return (self.ke_uri, self.organ_data.id, self.edge_data.id)
+
+    def iter_cytoscape_elements(self) -> Iterator[dict[str, Any]]:
+        """Iterate over Cytoscape elements one at a time.
+
+        Yields:
+            Dictionaries representing Cytoscape elements.
         """
-        return [{"data": self.organ_data.to_dict()}, {"data": self.edge_data.to_dict()}]
+        yield {"data": self.organ_data.to_dict()}
+        yield {"data": self.edge_data.to_dict()}
 
     @classmethod
     def from_cytoscape_elements(cls, elements: list[dict[str, Any]]) -> Sequence[BaseAssociation]:
@@ -811,15 +1463,17 @@ class OrganAssociation(BaseAssociation):
         associations = []
 
         # Collect nodes and edges
-        organ_nodes = cls._collect_nodes_by_type(elements, [NodeType.ORGAN.value])
-        associated_edges = cls._collect_edges_by_type(elements, [EdgeType.ASSOCIATED_WITH.value])
+        nodes_by_type, edges_by_type = cls._partition_elements(elements)
+        organ_nodes = nodes_by_type.get(_ORGAN_TYPE, {})
+        associated_edges = edges_by_type.get(_ASSOCIATED_WITH_TYPE, [])
 
         # Process organ-KE associations
+        ke_prefix = _KE_URI_PREFIX
         for edge in associated_edges:
             source_uri = edge.get("source", "")
             target_id = edge.get("target", "")
 
-            if cls._is_ke_uri(source_uri) and target_id in organ_nodes:
+            if source_uri.startswith(ke_prefix) and target_id in organ_nodes:
                 organ_data = organ_nodes[target_id]
 
                 # Find original element for classes
@@ -7,6 +7,11 @@ associations.
 """
 
 import logging
+import sys
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import repeat
 from typing import Any
 
 from pyaop.aop.associations import (
@@ -16,7 +21,7 @@ from pyaop.aop.associations import (
     GeneExpressionAssociation,
     OrganAssociation,
 )
-from pyaop.aop.constants import EdgeType, NodeType
+from pyaop.aop.constants import NodeType
 from pyaop.aop.core_model import (
     AOPInfo,
     AOPKeyEvent,
@@ -30,10 +35,77 @@ from pyaop.queries.bgee import BgeeQueryService
 
 logger = logging.getLogger(__name__)
 
+# AOP binding keys read for every row; key event titles are only read when needed
+_AOP_BINDING_KEYS = ("aop", "aop_title", "MIE", "ao", "KE_upstream", "KE_downstream", "KER")
+_COMPOUND_KEYS = ("aop", "chemical", "pubchem_compound", "compound_name", "cid", "mie")
+# Component binding keys, in ComponentAssociation field order
+_COMPONENT_KEYS = (
+    "ke",
+    "ke_name",
+    "process",
+    "processName",
+    "object",
+    "objectName",
+    "action",
+    "objectType",
+)
+_GENE_KEYS = ("ke", "gene", "protein")
+_ORGAN_KEYS = ("ke", "organ", "organ_name")
+# Bgee binding keys, in GeneExpressionAssociation field order
+_GENE_EXPRESSION_KEYS = (
+    "gene_id",
+    "anatomical_entity_id",
+    "anatomical_entity_name",
+    "expression_level",
+    "confidence_level_id",
+    "confidence_level_name",
+    "developmental_stage_id",
+    "developmental_stage_name",
+    "expr",
+)
+
+# Maximum number of URIs per VALUES clause; longer lists are split across queries
+_URI_CHUNK_SIZE = 500
+# Per query type chunk sizes, tunable for queries the endpoint finds heavier
+_GENE_CHUNK_SIZE = _URI_CHUNK_SIZE
+_COMPOUND_CHUNK_SIZE = _URI_CHUNK_SIZE
+_ORGAN_CHUNK_SIZE = _URI_CHUNK_SIZE
+_COMPONENT_CHUNK_SIZE = _URI_CHUNK_SIZE
+
+
+def _iter_uri_chunks(uris: list[str], size: int = _URI_CHUNK_SIZE) -> Iterator[list[str]]:
+    """Split a URI list into consecutive chunks.
+
+    Args:
+        uris: URIs to split.
+        size: Maximum number of URIs per chunk.
+
+    Yields:
+        Lists of at most ``size`` URIs.
+    """
+    for start in range(0, len(uris), size):
+        yield uris[start : start + size]
+
+
+@lru_cache(maxsize=8192)
+def _id_from_uri(uri: str) -> str:
+    """Extract the ID from a URI, cached as the same URIs recur across bindings.
+
+    Args:
+        uri: URI string.
+
+    Returns:
+        Extracted ID string, interned so every object holding it shares one copy.
+    """
+    # rpartition yields the whole URI when it has no "/", like the old split check
+    return sys.intern(uri.rpartition("/")[2])
+
 
 class SPARQLResultProcessor:
     """Processes SPARQL query results into AOP domain objects."""
 
+    __slots__ = ()
+
     @staticmethod
     def extract_binding_value(binding: dict[str, Any], key: str) -> str:
         """Extract value from SPARQL binding.
@@ -45,7 +117,41 @@ class SPARQLResultProcessor:
         Returns:
             Extracted value string.
         """
-        return str(binding.get(key, {}).get("value", ""))
+        # Bound SPARQL JSON terms always carry a string "value"
+        value = binding.get(key)
+        return value["value"] if value else ""
+
+    @staticmethod
+    def extract_many(binding: dict[str, Any], keys: tuple[str, ...]) -> tuple[str, ...]:
+        """Extract the values of several keys from a SPARQL binding.
+
+        Args:
+            binding: SPARQL binding dict.
+            keys: Keys to extract.
+
+        Returns:
+            Tuple of extracted value strings, in ``keys`` order.
+        """
+        get = binding.get
+        return tuple(term["value"] if (term := get(key)) else "" for key in keys)
+
+    @staticmethod
+    def _bindings_to_columns(
+        bindings: Iterable[dict[str, Any]], keys: tuple[str, ...]
+    ) -> list[list[str]]:
+        """Extract one column of values per key from SPARQL bindings.
+
+        Args:
+            bindings: SPARQL bindings; a one-shot iterable is materialized first.
+            keys: Keys to extract.
+
+        Returns:
+            List of value lists, one per key, aligned with ``bindings``.
+        """
+        if not isinstance(bindings, Sequence):
+            bindings = list(bindings)
+        value = SPARQLResultProcessor.extract_binding_value
+        return [[value(binding, key) for binding in bindings] for key in keys]
 
     @staticmethod
     def extract_id_from_uri(uri: str) -> str:
@@ -57,136 +163,147 @@ class SPARQLResultProcessor:
         Returns:
             Extracted ID string.
         """
-        return uri.split("/")[-1] if "/" in uri else uri
+        return _id_from_uri(uri)
 
 
 class AOPSPARQLProcessor(SPARQLResultProcessor):
     """Processes AOP-specific SPARQL results."""
 
+    __slots__ = ()
+
     def process_aop_bindings(
-        self, bindings: list[dict[str, Any]]
+        self,
+        bindings: Iterable[dict[str, Any]],
+        known_key_events: Mapping[str, AOPKeyEvent] | None = None,
     ) -> tuple[list[AOPKeyEvent], list[KeyEventRelationship], list[AOPInfo]]:
         """Process AOP SPARQL bindings into structured objects.
 
         Args:
-            bindings: List of SPARQL bindings.
+            bindings: SPARQL bindings, consumed in a single pass.
+            known_key_events: Key events from earlier queries by URI. They are
+                updated and returned instead of being recreated.
 
         Returns:
             Tuple of lists: key events, relationships, AOP infos.
         """
         key_events: dict[str, AOPKeyEvent] = {}
+        known = known_key_events if known_key_events is not None else {}
         relationships = []
-        aop_infos = []
+        aop_infos: dict[str, AOPInfo] = {}
+        extract = self.extract_many
+        previous_mie_uri = previous_ao_uri = None
+        previous_aop_info: AOPInfo | None = None
 
         for binding in bindings:
-            # Process AOP info
-            aop_info = self._extract_aop_info(binding)
-            if aop_info and aop_info not in aop_infos:
-                aop_infos.append(aop_info)
-            # Process key events
-            self._process_key_events_from_binding(binding, key_events, aop_info)
+            # Read every field of the binding once
+            aop_uri, aop_title, mie_uri, ao_uri, upstream_uri, downstream_uri, ker_uri = extract(
+                binding, _AOP_BINDING_KEYS
+            )
+
+            # Process AOP info, reusing the first instance seen for each AOP ID
+            aop_info = self._extract_aop_info(aop_uri, aop_title, aop_infos)
+
+            # Process MIE and AO, skipping them when the previous row of the same
+            # AOP already did, then upstream/downstream KEs that are neither
+            same_aop = aop_info is previous_aop_info
+            if not same_aop or mie_uri != previous_mie_uri:
+                self._process_single_key_event(
+                    mie_uri, binding, "MIEtitle", NodeType.MIE, key_events, known, aop_info
+                )
+            if not same_aop or ao_uri != previous_ao_uri:
+                self._process_single_key_event(
+                    ao_uri, binding, "ao_title", NodeType.AO, key_events, known, aop_info
+                )
+            previous_mie_uri, previous_ao_uri, previous_aop_info = mie_uri, ao_uri, aop_info
+            if upstream_uri and upstream_uri != mie_uri and upstream_uri != ao_uri:
+                self._process_single_key_event(
+                    upstream_uri,
+                    binding,
+                    "KE_upstream_title",
+                    NodeType.KE,
+                    key_events,
+                    known,
+                    aop_info,
+                )
+            if downstream_uri and downstream_uri != mie_uri and downstream_uri != ao_uri:
+                self._process_single_key_event(
+                    downstream_uri,
+                    binding,
+                    "KE_downstream_title",
+                    NodeType.KE,
+                    key_events,
+                    known,
+                    aop_info,
+                )
+
             # Process relationships
-            relationship = self._extract_relationship(binding, key_events)
+            relationship = self._extract_relationship(
+                ker_uri, upstream_uri, downstream_uri, key_events
+            )
             if relationship:
                 relationships.append(relationship)
-        return list(key_events.values()), relationships, aop_infos
+        return list(key_events.values()), relationships, list(aop_infos.values())
 
-    def _extract_aop_info(self, binding: dict[str, Any]) -> AOPInfo | None:
-        """Extract AOP info from binding.
+    def _extract_aop_info(
+        self, aop_uri: str, aop_title: str, aop_infos: dict[str, AOPInfo]
+    ) -> AOPInfo | None:
+        """Get AOP info for the AOP fields of a binding.
 
         Args:
-            binding: SPARQL binding dict.
+            aop_uri: AOP URI.
+            aop_title: AOP title.
+            aop_infos: Dict of AOP infos seen so far by AOP ID; a new one is added.
 
         Returns:
             AOPInfo object or None.
         """
-        aop_uri = self.extract_binding_value(binding, "aop")
-        aop_title = self.extract_binding_value(binding, "aop_title")
-
         if aop_uri and aop_title:
-            aop_id = self.extract_id_from_uri(aop_uri)
-            return AOPInfo(aop_id=aop_id, title=aop_title, uri=aop_uri)
+            aop_id = _id_from_uri(aop_uri)
+            aop_info = aop_infos.get(aop_id)
+            if aop_info is None:
+                aop_info = AOPInfo(aop_id=aop_id, title=aop_title, uri=aop_uri)
+                aop_infos[aop_id] = aop_info
+            return aop_info
         return None
 
-    def _process_key_events_from_binding(
-        self,
-        binding: dict[str, Any],
-        key_events: dict[str, AOPKeyEvent],
-        aop_info: AOPInfo | None,
-    ) -> None:
-        """Process all key events from a single binding.
-
-        Args:
-            binding: SPARQL binding dict.
-            key_events: Dict of existing key events.
-            aop_info: Associated AOP info.
-        """
-        # Process MIE
-        self._process_single_key_event(
-            binding, "MIE", "MIEtitle", NodeType.MIE, key_events, aop_info
-        )
-
-        # Process AO
-        self._process_single_key_event(binding, "ao", "ao_title", NodeType.AO, key_events, aop_info)
-
-        # Process upstream/downstream KEs
-        upstream_uri = self.extract_binding_value(binding, "KE_upstream")
-        downstream_uri = self.extract_binding_value(binding, "KE_downstream")
-        mie_uri = self.extract_binding_value(binding, "MIE")
-        ao_uri = self.extract_binding_value(binding, "ao")
-
-        if upstream_uri and upstream_uri not in [mie_uri, ao_uri]:
-            self._process_single_key_event(
-                binding,
-                "KE_upstream",
-                "KE_upstream_title",
-                NodeType.KE,
-                key_events,
-                aop_info,
-            )
-
-        if downstream_uri and downstream_uri not in [mie_uri, ao_uri]:
-            self._process_single_key_event(
-                binding,
-                "KE_downstream",
-                "KE_downstream_title",
-                NodeType.KE,
-                key_events,
-                aop_info,
-            )
-
     def _process_single_key_event(
         self,
+        uri: str,
         binding: dict[str, Any],
-        uri_key: str,
         title_key: str,
         ke_type: NodeType,
         key_events: dict[str, AOPKeyEvent],
+        known_key_events: Mapping[str, AOPKeyEvent],
         aop_info: AOPInfo | None,
     ) -> None:
         """Process a single key event from binding.
 
         Args:
+            uri: Key event URI.
             binding: SPARQL binding dict.
-            uri_key: Key for URI in binding.
-            title_key: Key for title in binding.
+            title_key: Key for title in binding, only read for a new key event.
             ke_type: Type of key event.
-            key_events: Dict of existing key events.
+            key_events: Dict of key events seen in these bindings.
+            known_key_events: Key events from earlier queries, reused when seen again.
             aop_info: Associated AOP info.
         """
-        uri = self.extract_binding_value(binding, uri_key)
-        title = self.extract_binding_value(binding, title_key)
-
         if not uri:
             return
 
-        if uri in key_events:
+        key_event = key_events.get(uri)
+        if key_event is None:
+            key_event = known_key_events.get(uri)
+            if key_event is not None:
+                key_events[uri] = key_event
+        if key_event is not None:
             # Update existing KE with new AOP info
             if aop_info:
-                key_events[uri].add_aop(aop_info)
+                key_event.add_aop(aop_info)
         else:
-            # Create new KE
-            ke_id = self.extract_id_from_uri(uri)
+            # Create new KE; its URI is shared by every association to it
+            uri = sys.intern(uri)
+            title = self.extract_binding_value(binding, title_key)
+            ke_id = _id_from_uri(uri)
             key_event = AOPKeyEvent(
                 ke_id=ke_id, uri=uri, title=title if title else "NA", ke_type=ke_type
             )
@@ -195,21 +312,23 @@ class AOPSPARQLProcessor(SPARQLResultProcessor):
             key_events[uri] = key_event
 
     def _extract_relationship(
-        self, binding: dict[str, Any], key_events: dict[str, AOPKeyEvent]
+        self,
+        ker_uri: str,
+        upstream_uri: str,
+        downstream_uri: str,
+        key_events: dict[str, AOPKeyEvent],
     ) -> KeyEventRelationship | None:
-        """Extract relationship from binding.
+        """Create a relationship from the KER fields of a binding.
 
         Args:
-            binding: SPARQL binding dict.
+            ker_uri: KER URI.
+            upstream_uri: Upstream key event URI.
+            downstream_uri: Downstream key event URI.
             key_events: Dict of existing key events.
 
         Returns:
             KeyEventRelationship object or None.
         """
-        ker_uri = self.extract_binding_value(binding, "KER")
-        upstream_uri = self.extract_binding_value(binding, "KE_upstream")
-        downstream_uri = self.extract_binding_value(binding, "KE_downstream")
-
         if (
             ker_uri
             and upstream_uri
@@ -217,7 +336,7 @@ class AOPSPARQLProcessor(SPARQLResultProcessor):
             and upstream_uri in key_events
             and downstream_uri in key_events
         ):
-            ker_id = self.extract_id_from_uri(ker_uri)
+            ker_id = _id_from_uri(ker_uri)
             return KeyEventRelationship(
                 ker_id=ker_id,
                 ker_uri=ker_uri,
@@ -230,50 +349,52 @@ class AOPSPARQLProcessor(SPARQLResultProcessor):
 class AssociationProcessor(SPARQLResultProcessor):
     """Processes association SPARQL results."""
 
+    __slots__ = ()
+
     def process_gene_associations(
-        self, bindings: list[dict[str, Any]], include_proteins: bool = True
+        self, bindings: Iterable[dict[str, Any]], include_proteins: bool = True
     ) -> list[GeneAssociation]:
         """Process gene association bindings.
 
         Args:
-            bindings: List of SPARQL bindings.
+            bindings: SPARQL bindings, consumed in a single pass.
             include_proteins: Whether to include protein data.
 
         Returns:
             List of GeneAssociation objects.
         """
-        associations = []
-        for binding in bindings:
-            ke_uri = self.extract_binding_value(binding, "ke")
-            gene_id = self.extract_binding_value(binding, "gene")
-            protein_id = (
-                self.extract_binding_value(binding, "protein") if include_proteins else None
-            )
-
-            if ke_uri and gene_id:
-                association = GeneAssociation(ke_uri=ke_uri, gene_id=gene_id, protein_id=protein_id)
-                associations.append(association)
-        return associations
+        protein_ids: Iterable[str | None]
+        if include_proteins:
+            ke_uris, gene_ids, protein_ids = self._bindings_to_columns(bindings, _GENE_KEYS)
+        else:
+            ke_uris, gene_ids = self._bindings_to_columns(bindings, _GENE_KEYS[:2])
+            protein_ids = repeat(None, len(ke_uris))
+        # Both required fields are checked here, so skip revalidation; KE URIs
+        # repeat for every gene of a KE, so keep a single copy of each
+        intern = sys.intern
+        return [
+            GeneAssociation._trusted(intern(ke_uri), gene_id, protein_id)
+            for ke_uri, gene_id, protein_id in zip(ke_uris, gene_ids, protein_ids, strict=True)
+            if ke_uri and gene_id
+        ]
 
     def process_compound_associations(
-        self, bindings: list[dict[str, Any]]
+        self, bindings: Iterable[dict[str, Any]]
     ) -> list[CompoundAssociation]:
         """Process compound association bindings.
 
         Args:
-            bindings: List of SPARQL bindings.
+            bindings: SPARQL bindings, consumed in a single pass.
 
         Returns:
             List of CompoundAssociation objects.
         """
         associations = []
+        extract = self.extract_many
         for binding in bindings:
-            aop_uri = self.extract_binding_value(binding, "aop")
-            chemical_uri = self.extract_binding_value(binding, "chemical")
-            pubchem_compound = self.extract_binding_value(binding, "pubchem_compound")
-            compound_name = self.extract_binding_value(binding, "compound_name")
-            cid = self.extract_binding_value(binding, "cid")
-            mie_uri = self.extract_binding_value(binding, "mie")
+            aop_uri, chemical_uri, pubchem_compound, compound_name, cid, mie_uri = extract(
+                binding, _COMPOUND_KEYS
+            )
             if aop_uri and chemical_uri and pubchem_compound:
                 association = CompoundAssociation(
                     aop_uri=aop_uri,
@@ -288,68 +409,68 @@ class AssociationProcessor(SPARQLResultProcessor):
         return associations
 
     def process_component_associations(
-        self, bindings: list[dict[str, Any]]
+        self, bindings: Iterable[dict[str, Any]]
     ) -> list[ComponentAssociation]:
         """Process component association bindings.
 
         Args:
-            bindings: List of SPARQL bindings.
+            bindings: SPARQL bindings, consumed in a single pass.
 
         Returns:
             List of ComponentAssociation objects.
         """
-        associations = []
-        for binding in bindings:
-            process_iri = self.extract_binding_value(binding, "process")
-            if not process_iri:
-                continue
-            association = ComponentAssociation(
-                ke_uri=self.extract_binding_value(binding, "ke"),
-                ke_name=self.extract_binding_value(binding, "ke_name"),
-                process=process_iri,
-                process_name=self.extract_binding_value(binding, "processName"),
-                object=self.extract_binding_value(binding, "object"),
-                object_name=self.extract_binding_value(binding, "objectName"),
-                action=self.extract_binding_value(binding, "action"),
-                object_type=self.extract_binding_value(binding, "objectType"),
-            )
-            associations.append(association)
-        return associations
+        extract = self.extract_many
+        return [
+            ComponentAssociation(*row)
+            for row in (extract(binding, _COMPONENT_KEYS) for binding in bindings)
+            if row[2]  # Skip bindings without a process IRI
+        ]
+
+    def process_gene_expression_associations(
+        self, bindings: Iterable[dict[str, Any]]
+    ) -> list[GeneExpressionAssociation]:
+        """Process Bgee gene expression bindings.
 
-    def process_organ_associations(self, bindings: list[dict[str, Any]]) -> list[OrganAssociation]:
+        Args:
+            bindings: SPARQL bindings, consumed in a single pass.
+
+        Returns:
+            List of GeneExpressionAssociation objects.
+        """
+        columns = self._bindings_to_columns(bindings, _GENE_EXPRESSION_KEYS)
+        # Rows without a gene ID are skipped
+        return [GeneExpressionAssociation(*row) for row in zip(*columns, strict=True) if row[0]]
+
+    def process_organ_associations(
+        self, bindings: Iterable[dict[str, Any]]
+    ) -> list[OrganAssociation]:
         """Process organ association bindings.
 
         Args:
-            bindings: List of SPARQL bindings.
+            bindings: SPARQL bindings, consumed in a single pass.
 
         Returns:
             List of OrganAssociation objects.
         """
         associations = []
-        for binding in bindings:
-            ke_uri = self.extract_binding_value(binding, "ke")
-            organ_uri = self.extract_binding_value(binding, "organ")
-            organ_name = self.extract_binding_value(binding, "organ_name")
+        # The same organ is returned for many KEs; build its node only once
+        organ_nodes: dict[str, CytoscapeNode] = {}
+        intern = sys.intern
+        columns = self._bindings_to_columns(bindings, _ORGAN_KEYS)
+        for ke_uri, organ_uri, organ_name in zip(*columns, strict=True):
             if not ke_uri or not organ_uri:
                 continue
-            organ_node = CytoscapeNode(
-                id=organ_uri,
-                label=(organ_name if organ_name else self.extract_id_from_uri(organ_uri)),
-                node_type=NodeType.ORGAN.value,
-                classes="organ-node",
-                properties={
-                    "anatomical_id": organ_uri,
-                    "anatomical_name": organ_name,
-                },
-            )
-            edge = CytoscapeEdge(
-                id=f"{ke_uri}_{organ_uri}",
-                source=ke_uri,
-                target=organ_uri,
-                label=EdgeType.ASSOCIATED_WITH.value,
-                properties={"type": EdgeType.ASSOCIATED_WITH.value},
-            )
-            association = OrganAssociation(ke_uri=ke_uri, organ_data=organ_node, edge_data=edge)
+            # Both URIs repeat across rows and end up in every edge
+            ke_uri = intern(ke_uri)
+            organ_uri = intern(organ_uri)
+            organ_node = organ_nodes.get(organ_uri)
+            if organ_node is None:
+                organ_node = CytoscapeNode.organ_node(
+                    organ_uri, organ_name if organ_name else _id_from_uri(organ_uri), organ_name
+                )
+                organ_nodes[organ_uri] = organ_node
+            edge = CytoscapeEdge.organ_edge(ke_uri, organ_uri)
+            association = OrganAssociation(ke_uri, organ_node, edge)
             associations.append(association)
         return associations
 
@@ -361,6 +482,14 @@ class AOPNetworkBuilder:
     Coordinate between query service and result processors to build networks.
     """
 
+    __slots__ = (
+        "_aop_processor",
+        "_aop_query_service",
+        "_assoc_processor",
+        "_bgee_query_service",
+        "network",
+    )
+
     def __init__(self) -> None:
         """Initialize the AOP network builder."""
         self.network = AOPNetwork()
@@ -387,8 +516,7 @@ class AOPNetworkBuilder:
         if query_result.success:
             # Step 2: Process results
             self._process_aop_query_results(query_result.data)
-            # Step 3: Build and return network
-            self.network = self._build_network()
+            # Step 3: Return the updated network
             return self.network, query_result.query
         return self.network, "# Identifier query failed"
 
@@ -405,7 +533,6 @@ class AOPNetworkBuilder:
         query_result = self._execute_organ_query(ke_uris)
         if query_result.success:
             self._process_organ_query_results(query_result.data)
-            self.network = self._build_network()
             return self.network, query_result.query
         return self.network, "# Organ query failed"
 
@@ -422,7 +549,6 @@ class AOPNetworkBuilder:
         query_result = self._execute_compound_query(aop_uris)
         if query_result.success:
             self._process_compound_query_results(query_result.data)
-            self.network = self._build_network()
             return self.network, query_result.query
         return self.network, "# Compound query failed"
 
@@ -442,7 +568,6 @@ class AOPNetworkBuilder:
         query_result = self._execute_component_query(ke_uris, go_only)
         if query_result.success:
             self._process_component_query_results(query_result.data)
-            self.network = self._build_network()
             return self.network, query_result.query
         return self.network, "# Component query failed"
 
@@ -460,14 +585,13 @@ class AOPNetworkBuilder:
         """
         gene_ids = self.network.get_gene_ids()
         organ_ids = self.network.get_organ_ids()
-        if gene_ids and organ_ids:
-            # Execute gene expression query
-            updated_network, query = self._execute_gene_expression_query(
-                confidence_level=confidence_level,
-            )
-            self.network = updated_network
-            return self.network, query
-        return self.network, "# Gene query failed"
+        if not gene_ids or not organ_ids:
+            logger.warning("No genes and organs found for gene expression querying")
+            return self.network, "# No genes and organs to query"
+        # Execute gene expression query
+        return self._execute_gene_expression_query(
+            gene_ids, organ_ids, confidence_level=confidence_level
+        )
 
     def query_genes_for_ke(self, include_proteins: bool = True) -> tuple[AOPNetwork, str]:
         """Query gene associations for all KEs in the network.
@@ -487,10 +611,140 @@ class AOPNetworkBuilder:
         if query_result.success:
             # Process results
             self._process_gene_query_results(query_result.data, include_proteins)
-            self.network = self._build_network()
             return self.network, query_result.query
         return self.network, "# Gene query failed"
 
+    def enrich_parallel(
+        self,
+        *,
+        organs: bool = True,
+        compounds: bool = True,
+        components: bool = True,
+        genes: bool = True,
+        go_only: bool = False,
+        include_proteins: bool = True,
+    ) -> tuple[AOPNetwork, list[str]]:
+        """Query organ, compound, component and gene associations concurrently.
+
+        The enabled queries are independent and network-bound, so they run in
+        a thread pool. Their results are then added to the network one at a
+        time, in the order of the arguments, so the network is only modified
+        from the calling thread.
+
+        Args:
+            organs: Whether to query organ associations for all KEs.
+            compounds: Whether to query compound associations for all AOPs.
+            components: Whether to query components for all KEs.
+            genes: Whether to query gene associations for all KEs.
+            go_only: Whether to filter components for GO only.
+            include_proteins: Whether to include protein data with genes.
+
+        Returns:
+            Tuple of AOPNetwork and the query string of each enabled query.
+        """
+        ke_uris = self.network.get_ke_uris()
+        aop_uris = self.network.get_aop_uris()
+        # Each step: URIs to query, messages when skipped or failed, query and processing
+        steps: list[
+            tuple[list[str], str, str, Callable[[], QueryResult], Callable[[dict[str, Any]], None]]
+        ] = []
+        if organs:
+            steps.append(
+                (
+                    ke_uris,
+                    "# No KEs to query",
+                    "# Organ query failed",
+                    partial(self._execute_organ_query, ke_uris),
+                    self._process_organ_query_results,
+                )
+            )
+        if compounds:
+            steps.append(
+                (
+                    aop_uris,
+                    "# No AOPs to query",
+                    "# Compound query failed",
+                    partial(self._execute_compound_query, aop_uris),
+                    self._process_compound_query_results,
+                )
+            )
+        if components:
+            steps.append(
+                (
+                    ke_uris,
+                    "# No KEs to query",
+                    "# Component query failed",
+                    partial(self._execute_component_query, ke_uris, go_only),
+                    self._process_component_query_results,
+                )
+            )
+        if genes:
+            steps.append(
+                (
+                    ke_uris,
+                    "# No KEs to query",
+                    "# Gene query failed",
+                    partial(self._execute_gene_query, ke_uris, include_proteins),
+                    partial(self._process_gene_query_results, include_proteins=include_proteins),
+                )
+            )
+        if not steps:
+            return self.network, []
+
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = [executor.submit(execute) if uris else None for uris, *_, execute, _ in steps]
+
+        queries = []
+        for (_, skipped, failed, _, process), future in zip(steps, futures, strict=True):
+            if future is None:
+                queries.append(skipped)
+                continue
+            query_result = future.result()
+            if query_result.success:
+                process(query_result.data)
+                queries.append(query_result.query)
+            else:
+                queries.append(failed)
+        return self.network, queries
+
+    def _execute_chunked_query(
+        self,
+        uris: list[str],
+        build_query: Callable[[str], str],
+        uri_prefix: str = "",
+        chunk_size: int = _URI_CHUNK_SIZE,
+    ) -> QueryResult:
+        """Execute a query over chunks of a URI list and merge the bindings.
+
+        Args:
+            uris: URIs, or URI suffixes when ``uri_prefix`` is given.
+            build_query: Builds the query for a space-separated chunk of ``<URI>`` terms.
+            uri_prefix: Prefix prepended to each entry of ``uris``.
+            chunk_size: Maximum number of URIs per query.
+
+        Returns:
+            QueryResult with the bindings of every chunk and the queries run.
+
+        Raises:
+            QueryServiceError: If any chunk query fails.
+        """
+        queries = []
+        chunk_results = []
+        for chunk in _iter_uri_chunks(uris, chunk_size):
+            query = build_query(" ".join(f"<{uri_prefix}{uri}>" for uri in chunk))
+            chunk_results.append(self._aop_query_service.execute_sparql_query(query))
+            queries.append(query)
+        if len(chunk_results) == 1:
+            return QueryResult(data=chunk_results[0], query=queries[0], success=True)
+        bindings = [
+            binding
+            for results in chunk_results
+            for binding in results.get("results", {}).get("bindings", [])
+        ]
+        return QueryResult(
+            data={"results": {"bindings": bindings}}, query="\n".join(queries), success=True
+        )
+
     def _execute_aop_query(self, query_type: str, values: str, status: list[str]) -> QueryResult:
         """Execute AOP SPARQL query and return structured result.
 
@@ -501,7 +755,7 @@ class AOPNetworkBuilder:
         Returns:
             QueryResult object.
         """
-        formatted_status = " ".join([f'"{i}"' for i in status])
+        formatted_status = " ".join(f'"{i}"' for i in status)
         if len(status) == 3:
             formatted_status = ""
         query = self._aop_query_service.build_aop_sparql_query(query_type, values, formatted_status)
@@ -522,14 +776,12 @@ class AOPNetworkBuilder:
         """
         bindings = sparql_data.get("results", {}).get("bindings", [])
 
-        kes, rels, _ = self._aop_processor.process_aop_bindings(bindings)
+        # Reuse the network's key events so later queries extend them
+        kes, rels, _ = self._aop_processor.process_aop_bindings(bindings, self.network.key_events)
 
         # Add to network
-        for ke in kes:
-            self.network.add_key_event(ke)
-
-        for rel in rels:
-            self.network.add_relationship(rel)
+        self.network.add_key_events_bulk(kes)
+        self.network.add_relationships_bulk(rels)
 
         # AOP infos are already added through key events
 
@@ -544,12 +796,14 @@ class AOPNetworkBuilder:
             QueryResult object.
         """
         try:
-            formatted_uris = " ".join([f"<{uri}>" for uri in ke_uris])
-            query = self._aop_query_service.build_gene_sparql_query(
-                formatted_uris, include_proteins
+            return self._execute_chunked_query(
+                ke_uris,
+                partial(
+                    self._aop_query_service.build_gene_sparql_query,
+                    include_proteins=include_proteins,
+                ),
+                chunk_size=_GENE_CHUNK_SIZE,
             )
-            results = self._aop_query_service.execute_sparql_query(query)
-            return QueryResult(data=results, query=query, success=True)
         except QueryServiceError as e:
             return QueryResult(data={}, query="", success=False, error=str(e))
 
@@ -564,9 +818,7 @@ class AOPNetworkBuilder:
         """
         bindings = sparql_data.get("results", {}).get("bindings", [])
         associations = self._assoc_processor.process_gene_associations(bindings, include_proteins)
-
-        for assoc in associations:
-            self.network.add_gene_association(assoc)
+        self.network.add_gene_associations_bulk(associations)
 
     def _execute_compound_query(self, aop_uris: list[str]) -> QueryResult:
         """Execute compound association query.
@@ -578,33 +830,37 @@ class AOPNetworkBuilder:
             QueryResult object.
         """
         try:
-            formatted_uris = " ".join([f"<https://identifiers.org/aop/{uri}>" for uri in aop_uris])
-            query = self._aop_query_service.build_compound_sparql_query(formatted_uris)
-            results = self._aop_query_service.execute_sparql_query(query)
-            return QueryResult(data=results, query=query, success=True)
+            return self._execute_chunked_query(
+                aop_uris,
+                self._aop_query_service.build_compound_sparql_query,
+                uri_prefix="https://identifiers.org/aop/",
+                chunk_size=_COMPOUND_CHUNK_SIZE,
+            )
         except QueryServiceError as e:
             return QueryResult(data={}, query="", success=False, error=str(e))
 
     def _execute_gene_expression_query(
         self,
+        gene_ids: list[str],
+        organ_ids: list[str],
         confidence_level: int = 50,
     ) -> tuple[AOPNetwork, str]:
         """Execute gene expression query.
 
         Args:
+            gene_ids: Gene IDs from the current network.
+            organ_ids: Organ names from the current network.
             confidence_level: Minimum confidence level.
 
         Returns:
             Tuple of AOPNetwork and query string.
         """
         try:
-            # Get gene and organ IDs from current network
-            gene_ids = self.network.get_gene_ids()
-            organ_ids = self.network.get_organ_ids()
-
             # Format for SPARQL query
             formatted_gene_ids = [f'"{eid}"' for eid in gene_ids if eid]
             formatted_organ_ids = [f'"{oid}"' for oid in organ_ids if oid]
+            if not formatted_gene_ids or not formatted_organ_ids:
+                return self.network, "# No genes and organs to query"
 
             # Build and execute query
             query = self._bgee_query_service.build_gene_expressions_query(
@@ -614,31 +870,10 @@ class AOPNetworkBuilder:
 
             # Process results into associations
             gene_expression_results = results.get("results", {}).get("bindings", [])
-            for result in gene_expression_results:
-                try:
-                    gene_id = result.get("gene_id", {}).get("value", "")
-                    if not gene_id:
-                        continue
-
-                    association = GeneExpressionAssociation(
-                        gene_id=gene_id,
-                        anatomical_id=result.get("anatomical_entity_id", {}).get("value", ""),
-                        anatomical_name=result.get("anatomical_entity_name", {}).get("value", ""),
-                        expression_level=result.get("expression_level", {}).get("value", ""),
-                        confidence_id=result.get("confidence_level_id", {}).get("value", ""),
-                        confidence_level_name=result.get("confidence_level_name", {}).get(
-                            "value", ""
-                        ),
-                        developmental_id=result.get("developmental_stage_id", {}).get("value", ""),
-                        developmental_stage_name=result.get("developmental_stage_name", {}).get(
-                            "value", ""
-                        ),
-                        expr=result.get("expr", {}).get("value", ""),
-                    )
-                    self.network.add_gene_expression_association(association)
-                except QueryServiceError as e:
-                    logger.warning("Failed to process gene expression result: %s", e)
-                    continue
+            associations = self._assoc_processor.process_gene_expression_associations(
+                gene_expression_results
+            )
+            self.network.add_gene_expression_associations_bulk(associations)
 
             return self.network, query
         except QueryServiceError as e:
@@ -655,10 +890,11 @@ class AOPNetworkBuilder:
             QueryResult object.
         """
         try:
-            formatted_uris = " ".join([f"<{uri}>" for uri in ke_uris])
-            query = self._aop_query_service.build_organ_sparql_query(formatted_uris)
-            results = self._aop_query_service.execute_sparql_query(query)
-            return QueryResult(data=results, query=query, success=True)
+            return self._execute_chunked_query(
+                ke_uris,
+                self._aop_query_service.build_organ_sparql_query,
+                chunk_size=_ORGAN_CHUNK_SIZE,
+            )
         except QueryServiceError as e:
             return QueryResult(data={}, query="", success=False, error=str(e))
 
@@ -673,10 +909,11 @@ class AOPNetworkBuilder:
             QueryResult object.
         """
         try:
-            formatted_uris = " ".join([f"<{uri}>" for uri in ke_uris])
-            query = self._aop_query_service.build_components_sparql_query(go_only, formatted_uris)
-            results = self._aop_query_service.execute_sparql_query(query)
-            return QueryResult(data=results, query=query, success=True)
+            return self._execute_chunked_query(
+                ke_uris,
+                partial(self._aop_query_service.build_components_sparql_query, go_only),
+                chunk_size=_COMPONENT_CHUNK_SIZE,
+            )
         except QueryServiceError as e:
             return QueryResult(data={}, query="", success=False, error=str(e))
 
@@ -688,9 +925,7 @@ class AOPNetworkBuilder:
         """
         bindings = sparql_data.get("results", {}).get("bindings", [])
         associations = self._assoc_processor.process_compound_associations(bindings)
-
-        for assoc in associations:
-            self.network.add_compound_association(assoc)
+        self.network.add_compound_associations_bulk(associations)
 
     def _process_organ_query_results(self, sparql_data: dict[str, Any]) -> None:
         """Process organ query results.
@@ -700,9 +935,7 @@ class AOPNetworkBuilder:
         """
         bindings = sparql_data.get("results", {}).get("bindings", [])
         associations = self._assoc_processor.process_organ_associations(bindings)
-
-        for assoc in associations:
-            self.network.add_organ_association(assoc)
+        self.network.add_organ_associations_bulk(associations)
 
     def _process_component_query_results(self, sparql_data: dict[str, Any]) -> None:
         """Process component query results.
@@ -712,9 +945,7 @@ class AOPNetworkBuilder:
         """
         bindings = sparql_data.get("results", {}).get("bindings", [])
         associations = self._assoc_processor.process_component_associations(bindings)
-
-        for assoc in associations:
-            self.network.add_component_association(assoc)
+        self.network.add_component_associations_bulk(associations)
 
     def update_from_json(self, cytoscape_json: dict[str, Any]) -> AOPNetwork:
         """
@@ -734,11 +965,3 @@ class AOPNetworkBuilder:
         # Update the network using the from_cytoscape_elements method
         self.network.from_cytoscape_elements(elements)
         return self.network
-
-    def _build_network(self) -> AOPNetwork:
-        """Build and return the current network state.
-
-        Returns:
-            AOPNetwork object.
-        """
-        return self.network
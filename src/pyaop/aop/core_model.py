@@ -5,6 +5,8 @@ Includes the main container for complete AOP network data (AOPNetwork).
 """
 
 import logging
+from collections.abc import Iterable
+from itertools import chain
 from typing import Any
 
 from pyaop.aop.aop_info import (
@@ -207,6 +209,36 @@ class AOPNetwork:
         self.add_key_event(relationship.downstream_ke)
         self.relationships.append(relationship)
 
+    def add_key_events_bulk(self, key_events: Iterable[AOPKeyEvent]) -> None:
+        """Add many key events to the network at once.
+
+        Args:
+            key_events: AOPKeyEvents to add.
+        """
+        key_events = list(key_events)
+        self.key_events.update((key_event.uri, key_event) for key_event in key_events)
+
+        # Register AOP info
+        aop_info = self.aop_info
+        for key_event in key_events:
+            for aop in key_event.associated_aops:
+                aop_info.setdefault(aop.aop_id, aop)
+
+    def add_relationships_bulk(self, relationships: Iterable[KeyEventRelationship]) -> None:
+        """Add many key event relationships at once.
+
+        Args:
+            relationships: KeyEventRelationships to add.
+        """
+        relationships = list(relationships)
+        # Ensure both KEs of every relationship are in the network
+        self.add_key_events_bulk(
+            key_event
+            for relationship in relationships
+            for key_event in (relationship.upstream_ke, relationship.downstream_ke)
+        )
+        self.relationships.extend(relationships)
+
     def add_gene_association(self, association: GeneAssociation) -> None:
         """Add a gene association.
 
@@ -252,17 +284,88 @@ class AOPNetwork:
         self.organ_associations.append(association)
         self._update_nodes_and_edges(association)
 
+    def add_gene_associations_bulk(self, associations: Iterable[GeneAssociation]) -> None:
+        """Add many gene associations at once.
+
+        Args:
+            associations: GeneAssociations to add.
+        """
+        self._add_associations_bulk(self.gene_associations, associations)
+
+    def add_gene_expression_associations_bulk(
+        self, associations: Iterable[GeneExpressionAssociation]
+    ) -> None:
+        """Add many gene expression associations at once.
+
+        Args:
+            associations: GeneExpressionAssociations to add.
+        """
+        self._add_associations_bulk(self.gene_expression_associations, associations)
+
+    def add_compound_associations_bulk(self, associations: Iterable[CompoundAssociation]) -> None:
+        """Add many compound associations at once.
+
+        Args:
+            associations: CompoundAssociations to add.
+        """
+        self._add_associations_bulk(self.compound_associations, associations)
+
+    def add_component_associations_bulk(self, associations: Iterable[ComponentAssociation]) -> None:
+        """Add many component associations at once.
+
+        Args:
+            associations: ComponentAssociations to add.
+        """
+        self._add_associations_bulk(self.component_associations, associations)
+
+    def add_organ_associations_bulk(self, associations: Iterable[OrganAssociation]) -> None:
+        """Add many organ associations at once.
+
+        Args:
+            associations: OrganAssociations to add.
+        """
+        self._add_associations_bulk(self.organ_associations, associations)
+
+    def _add_associations_bulk(
+        self, association_list: list[Any], associations: Iterable[BaseAssociation]
+    ) -> None:
+        """Append associations to a list and update node_list and edge_list once.
+
+        Existing node and edge IDs are collected a single time, rather than
+        scanned again for every node and edge of every association.
+
+        Args:
+            association_list: Network list the associations belong to.
+            associations: Associations to add.
+        """
+        associations = list(associations)
+        association_list.extend(associations)
+
+        node_ids = {node.id for node in self.node_list}
+        edge_ids = {edge.id for edge in self.edge_list}
+        for association in associations:
+            new_nodes, new_edges = association.get_nodes_and_edges()
+            # Avoid duplicates by checking node and edge IDs
+            for node in new_nodes:
+                if node.id not in node_ids:
+                    node_ids.add(node.id)
+                    self.node_list.append(node)
+            for edge in new_edges:
+                if edge.id not in edge_ids:
+                    edge_ids.add(edge.id)
+                    self.edge_list.append(edge)
+
     def _update_nodes_and_edges(self, association: BaseAssociation) -> None:
         """Update node_list and edge_list from association."""
+        new_nodes, new_edges = association.get_nodes_and_edges()
+
         # Add nodes
-        new_nodes = association.get_nodes()
         for node in new_nodes:
             # Avoid duplicates by checking node ID
             if not any(existing_node.id == node.id for existing_node in self.node_list):
                 self.node_list.append(node)
 
         # Add edges
-        new_edges = association.get_edges()
         for edge in new_edges:
             # Avoid duplicates by checking edge ID
             if not any(existing_edge.id == edge.id for existing_edge in self.edge_list):
@@ -300,7 +403,8 @@ class AOPNetwork:
 
     def get_gene_ids(self) -> list[str]:
         """Retrieve all Gene IDs from nodes in the network."""
-        gene_ids = []
+        # Dict keys keep first-seen order with O(1) duplicate checks
+        gene_ids: dict[str, None] = {}
 
         # Check node_list for Gene nodes
         for node in self.node_list:
@@ -314,19 +418,20 @@ class AOPNetwork:
                     else:
                         gene_id = node.label
 
-                if gene_id and gene_id not in gene_ids:
-                    gene_ids.append(gene_id)
+                if gene_id:
+                    gene_ids[gene_id] = None
 
         # Also check gene_associations for backward compatibility
         for gene_assoc in self.gene_associations:
-            if gene_assoc.gene_id and gene_assoc.gene_id not in gene_ids:
-                gene_ids.append(gene_assoc.gene_id)
+            if gene_assoc.gene_id:
+                gene_ids[gene_assoc.gene_id] = None
 
-        return gene_ids
+        return list(gene_ids)
 
     def get_organ_ids(self) -> list[str]:
         """Retrieve all organ IDs/names from nodes in the network."""
-        organ_ids = []
+        # Dict keys keep first-seen order with O(1) duplicate checks
+        organ_ids: dict[str, None] = {}
 
         # Check node_list for organ nodes
         for node in self.node_list:
@@ -336,8 +441,8 @@ class AOPNetwork:
                 if not organ_name:
                     organ_name = node.label
 
-                if organ_name and organ_name not in organ_ids:
-                    organ_ids.append(organ_name)
+                if organ_name:
+                    organ_ids[organ_name] = None
 
         # Also check organ_associations for backward compatibility
         for organ_assoc in self.organ_associations:
@@ -345,9 +450,9 @@ class AOPNetwork:
             if organ_node and organ_node.is_instance_of(NodeType.ORGAN):
                 # Use anatomical_name (organ name) rather than full URI
                 organ_name = organ_node.properties.get("anatomical_name", organ_node.label)
-                if organ_name and organ_name not in organ_ids:
-                    organ_ids.append(organ_name)
-        return organ_ids
+                if organ_name:
+                    organ_ids[organ_name] = None
+        return list(organ_ids)
 
     def to_cytoscape_elements(self, include_styles: bool = True) -> dict[str, Any]:
         """Convert entire network to Cytoscape format with optional styles.
@@ -368,25 +473,18 @@ class AOPNetwork:
         for relationship in self.relationships:
             elements.append({"data": relationship.to_cytoscape_data()})
 
-        # Add gene associations
-        for gene_assoc in self.gene_associations:
-            elements.extend(gene_assoc.to_cytoscape_elements())
-
-        # Add compound associations
-        for compound_assoc in self.compound_associations:
-            elements.extend(compound_assoc.to_cytoscape_elements())
-
-        # Add component associations
-        for comp_assoc in self.component_associations:
-            elements.extend(comp_assoc.to_cytoscape_elements())
-
-        # Add organ associations
-        for organ_assoc in self.organ_associations:
-            elements.extend(organ_assoc.to_cytoscape_elements())
-
-        # Add gene expression associations
-        for expr_assoc in self.gene_expression_associations:
-            elements.extend(expr_assoc.to_cytoscape_elements())
+        # Add association elements, emitting nodes and edges shared between associations once
+        elements.extend(
+            BaseAssociation.bulk_to_cytoscape_elements(
+                chain(
+                    self.gene_associations,
+                    self.compound_associations,
+                    self.component_associations,
+                    self.organ_associations,
+                    self.gene_expression_associations,
+                )
+            )
+        )
 
         # Prepare response with elements
         result: dict[str, Any] = {"elements": elements}
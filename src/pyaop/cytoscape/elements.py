@@ -15,10 +15,15 @@ logger = logging.getLogger(__name__)
 _existing_nodes: dict[str, "CytoscapeNode"] = {}
 _existing_node_labels: dict[str, "CytoscapeNode"] = {}
 
+_ASSOCIATED_WITH = EdgeType.ASSOCIATED_WITH.value
+_ORGAN_NODE_TYPE = NodeType.ORGAN.value
+
 
 class CytoscapeEdge:
     """Represents an edge in Cytoscape format."""
 
+    __slots__ = ("id", "label", "properties", "source", "target")
+
     def __init__(self, id: str, source: str, target: str, label: str, properties: dict[str, Any]):
         """Initialize the edge.
 
@@ -70,6 +75,26 @@ class CytoscapeEdge:
 
         return edge
 
+    @classmethod
+    def organ_edge(cls, ke_uri: str, organ_uri: str) -> "CytoscapeEdge":
+        """Create the edge linking a key event to an organ.
+
+        Args:
+            ke_uri: Key event URI.
+            organ_uri: Organ URI.
+
+        Returns:
+            CytoscapeEdge object.
+        """
+        # Each edge gets its own properties dict, since merge_properties mutates it
+        return cls(
+            ke_uri + "_" + organ_uri,
+            ke_uri,
+            organ_uri,
+            _ASSOCIATED_WITH,
+            {"type": _ASSOCIATED_WITH},
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary format for Cytoscape.
 
@@ -119,6 +144,8 @@ class CytoscapeEdge:
 class CytoscapeNode:
     """Represents a node in Cytoscape format."""
 
+    __slots__ = ("classes", "id", "label", "node_type", "properties")
+
     def __new__(
         cls,
         id: str,
@@ -226,6 +253,26 @@ class CytoscapeNode:
 
         return node
 
+    @classmethod
+    def organ_node(cls, uri: str, label: str, name: str) -> "CytoscapeNode":
+        """Create an organ node, or return the registered node it resolves to.
+
+        Args:
+            uri: Organ URI, used as the node ID.
+            label: Node label.
+            name: Anatomical name as returned by the query, possibly empty.
+
+        Returns:
+            CytoscapeNode object.
+        """
+        return cls(
+            uri,
+            label,
+            _ORGAN_NODE_TYPE,
+            "organ-node",
+            {"anatomical_id": uri, "anatomical_name": name},
+        )
+
     @classmethod
     def get_existing_node(cls, node_id: str) -> Optional["CytoscapeNode"]:
         """Get an existing node by ID.
@@ -5,6 +5,7 @@ Prepare, send and retrieve query (results).
 """
 
 import logging
+from functools import lru_cache
 
 from pyaop.queries.base_query_service import BaseQueryService
 
@@ -30,7 +31,9 @@ class AOPQueryService(BaseQueryService):
         """
         return "AOP-Wiki"
 
-    def build_aop_sparql_query(self, query_type: str, values: str, status: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def build_aop_sparql_query(query_type: str, values: str, status: str) -> str:
         """Build SPARQL query for AOP data.
 
         Args:
@@ -167,7 +170,9 @@ WHERE {
             final_query = base_query.replace("%VALUES_CLAUSE%", values_clause)
         return final_query
 
-    def build_gene_sparql_query(self, ke_uris: str, include_proteins: bool = True) -> str:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def build_gene_sparql_query(ke_uris: str, include_proteins: bool = True) -> str:
         """Build SPARQL query for gene data.
 
         Args:
@@ -201,7 +206,9 @@ WHERE {
                 }}
             """
 
-    def build_compound_sparql_query(self, aop_uris: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def build_compound_sparql_query(aop_uris: str) -> str:
         """Build SPARQL query for compound data.
 
         Args:
@@ -227,7 +234,9 @@ WHERE {
     ORDER BY ?compound_name
 """
 
-    def build_organ_sparql_query(self, ke_uris: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def build_organ_sparql_query(ke_uris: str) -> str:
         """Build SPARQL query for organ data.
 
         Args:
@@ -244,7 +253,9 @@ WHERE {
         }}
         """
 
-    def build_components_sparql_query(self, go_only: bool, ke_uris: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def build_components_sparql_query(go_only: bool, ke_uris: str) -> str:
         """Build SPARQL query for GO process data.
 
         Args:
@@ -5,6 +5,7 @@ Prepare, send and retrieve query (results).
 """
 
 import logging
+from functools import lru_cache
 
 from pyaop.queries.base_query_service import BaseQueryService
 
@@ -42,16 +43,19 @@ class BgeeQueryService(BaseQueryService):
         Returns:
             SPARQL query string.
         """
-        return self._build_bgee_sparql_query(gene_ids, organ_ids, confidence_level)
+        # Tuples make the arguments hashable for the query cache
+        return self._build_bgee_sparql_query(tuple(gene_ids), tuple(organ_ids), confidence_level)
 
+    @staticmethod
+    @lru_cache(maxsize=128)
     def _build_bgee_sparql_query(
-        self, gene_ids: list[str], organ_ids: list[str], confidence_level: int | None = None
+        gene_ids: tuple[str, ...], organ_ids: tuple[str, ...], confidence_level: int | None = None
     ) -> str:
         """Build SPARQL query for Bgee gene expression data.
 
         Args:
-            gene_ids: List of gene IDs.
-            organ_ids: List of organ IDs.
+            gene_ids: Gene IDs.
+            organ_ids: Organ IDs.
             confidence_level: Minimum confidence level.
 
         Returns:
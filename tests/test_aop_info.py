@@ -0,0 +1,119 @@
+"""Tests for AOP information classes."""
+
+import unittest
+from dataclasses import dataclass
+
+from pyaop.aop.aop_info import AOPInfo, AOPKeyEvent
+from pyaop.aop.constants import NodeType
+
+KE_URI = "https://identifiers.org/aop.events/1"
+
+
+class TestKeyEventCytoscapeData(unittest.TestCase):
+    """Test the cached Cytoscape data of key events."""
+
+    def setUp(self) -> None:
+        """Build a key event with one AOP."""
+        self.aop = AOPInfo("1", "First AOP", "https://identifiers.org/aop/1")
+        self.key_event = AOPKeyEvent("1", KE_URI, "Event", NodeType.KE, [self.aop])
+
+    def test_returned_lists_are_copies(self) -> None:
+        """Test that modifying returned data does not affect later calls."""
+        data = self.key_event.to_cytoscape_data()
+        data["aop_uris"].append("https://identifiers.org/aop/2")
+        data["aop_titles"].clear()
+        data["label"] = "Changed"
+        fresh = self.key_event.to_cytoscape_data()
+        self.assertEqual([self.aop.uri], fresh["aop_uris"])
+        self.assertEqual([self.aop.title], fresh["aop_titles"])
+        self.assertEqual("Event", fresh["label"])
+
+    def test_add_aop_updates_data(self) -> None:
+        """Test that AOPs added after the first call are included."""
+        self.key_event.to_cytoscape_data()
+        other = AOPInfo("2", "Second AOP", "https://identifiers.org/aop/2")
+        self.assertTrue(self.key_event.add_aop(other))
+        self.assertFalse(self.key_event.add_aop(other))
+        data = self.key_event.to_cytoscape_data()
+        self.assertEqual([self.aop.uri, other.uri], data["aop_uris"])
+        self.assertEqual([self.aop.title, other.title], data["aop_titles"])
+
+    def test_field_assignment_updates_data(self) -> None:
+        """Test that reassigning the title or type invalidates the cache."""
+        self.key_event.to_cytoscape_data()
+        self.assertEqual(f"{NodeType.KE.value}:1", str(self.key_event))
+        self.key_event.title = "Renamed"
+        self.key_event.ke_type = NodeType.MIE
+        data = self.key_event.to_cytoscape_data()
+        self.assertEqual("Renamed", data["label"])
+        self.assertEqual(NodeType.MIE.value, data["type"])
+        self.assertTrue(data["is_mie"])
+        self.assertEqual(f"{NodeType.MIE.value}:1", str(self.key_event))
+
+    def test_aop_list_assignment_updates_data(self) -> None:
+        """Test that reassigning the AOP list replaces the AOPs in data and membership."""
+        self.key_event.to_cytoscape_data()
+        other = AOPInfo("2", "Second AOP", "https://identifiers.org/aop/2")
+        self.key_event.associated_aops = [other]
+        data = self.key_event.to_cytoscape_data()
+        self.assertEqual([other.uri], data["aop_uris"])
+        self.assertEqual([other.title], data["aop_titles"])
+        self.assertFalse(self.key_event.add_aop(other))
+        self.assertTrue(self.key_event.add_aop(self.aop))
+        self.assertEqual(["2", "1"], self.key_event.get_aop_ids())
+        self.assertEqual([other.uri, self.aop.uri], self.key_event.to_cytoscape_data()["aop_uris"])
+
+
+class TestParseAOPInfo(unittest.TestCase):
+    """Test parsing AOP information from Cytoscape elements."""
+
+    def test_malformed_pairs_are_skipped(self) -> None:
+        """Test that malformed AOP pairs are skipped without aborting the parse."""
+        elements = [
+            {
+                "data": {
+                    "id": KE_URI,
+                    "aop_uris": [
+                        "https://identifiers.org/aop/",
+                        "https://identifiers.org/aop/1",
+                        "",
+                        "https://identifiers.org/aop/2",
+                    ],
+                    "aop_titles": ["No ID", "First AOP", "No URI", ""],
+                }
+            },
+            # Misaligned URI and title lists are skipped as a whole
+            {"data": {"aop_uris": ["https://identifiers.org/aop/3"], "aop_titles": ["A", "B"]}},
+            {"data": {"aop_uris": "https://identifiers.org/aop/4", "aop_titles": "Fourth AOP"}},
+            {"group": "edges", "data": {"aop_uris": ["https://identifiers.org/aop/5"]}},
+        ]
+        aop_infos = AOPInfo.from_cytoscape_elements(elements)
+        self.assertEqual(["1", "4"], [aop.aop_id for aop in aop_infos])
+        self.assertEqual(["First AOP", "Fourth AOP"], [aop.title for aop in aop_infos])
+
+    def test_subclass_instances_are_initialized(self) -> None:
+        """Test that subclasses are built through their own initializer."""
+
+        @dataclass(frozen=True, slots=True, eq=False)
+        class TaggedAOPInfo(AOPInfo):
+            tag: str = "tagged"
+
+            def __post_init__(self) -> None:
+                AOPInfo.__post_init__(self)
+                if self.title == "Invalid":
+                    raise ValueError("Invalid title")
+
+        elements = [
+            {
+                "data": {
+                    "aop_uris": ["https://identifiers.org/aop/1"],
+                    "aop_titles": ["First AOP"],
+                }
+            }
+        ]
+        (aop_info,) = TaggedAOPInfo.from_cytoscape_elements(elements)
+        self.assertIsInstance(aop_info, TaggedAOPInfo)
+        self.assertEqual("tagged", aop_info.tag)
+        elements[0]["data"]["aop_titles"] = ["Invalid"]
+        with self.assertRaises(ValueError):
+            TaggedAOPInfo.from_cytoscape_elements(elements)
@@ -0,0 +1,151 @@
+"""Tests for association equality and deduplication."""
+
+import dataclasses
+import unittest
+
+from pyaop.aop.associations import (
+    BaseAssociation,
+    ComponentAssociation,
+    CompoundAssociation,
+    GeneAssociation,
+    GeneExpressionAssociation,
+)
+from pyaop.cytoscape.elements import CytoscapeNode
+
+KE_URI = "https://identifiers.org/aop.events/1"
+
+
+def _expression(**overrides: str) -> GeneExpressionAssociation:
+    """Build a gene expression association, overriding some fields."""
+    fields = {
+        "gene_id": "ENSG00000141510",
+        "anatomical_id": "UBERON_0002107",
+        "anatomical_name": "liver",
+        "expression_level": "95.5",
+        "confidence_id": "CIO_0000029",
+        "confidence_level_name": "high confidence",
+        "developmental_id": "UBERON_0000104",
+        "developmental_stage_name": "life cycle",
+    }
+    fields.update(overrides)
+    return GeneExpressionAssociation(**fields)
+
+
+def _compound(**overrides: str) -> CompoundAssociation:
+    """Build a compound association, overriding some fields."""
+    fields = {
+        "aop_uri": "https://identifiers.org/aop/1",
+        "mie_uri": "https://identifiers.org/aop.events/10",
+        "chemical_uri": "https://identifiers.org/cas/50-00-0",
+        "chemical_label": "formaldehyde",
+        "pubchem_compound": "https://pubchem.ncbi.nlm.nih.gov/compound/712",
+        "compound_name": "formaldehyde",
+    }
+    fields.update(overrides)
+    return CompoundAssociation(**fields)
+
+
+class TestAssociationEquality(unittest.TestCase):
+    """Test that associations compare and hash by all distinguishing fields."""
+
+    def test_base_natural_key_is_abstract(self) -> None:
+        """Test that the natural key must be implemented by subclasses."""
+        self.assertIn("_natural_key", BaseAssociation.__abstractmethods__)
+
+    def test_identical_rows_deduplicate(self) -> None:
+        """Test that identical associations are equal and collapse in a set."""
+        self.assertEqual(_expression(), _expression())
+        self.assertEqual(hash(_expression()), hash(_expression()))
+        self.assertEqual(1, len({_expression(), _expression()}))
+        self.assertEqual(1, len({_compound(), _compound()}))
+        gene = GeneAssociation(KE_URI, "TP53", "P04637")
+        self.assertEqual(1, len({gene, GeneAssociation._trusted(gene.ke_uri, "TP53", "P04637")}))
+
+    def test_gene_expression_rows_differing_in_level_are_kept(self) -> None:
+        """Test that Bgee rows differing only in expression or confidence stay distinct."""
+        base = _expression()
+        other_level = _expression(expression_level="12.0")
+        other_confidence = _expression(
+            confidence_id="CIO_0000031", confidence_level_name="low confidence"
+        )
+        self.assertNotEqual(base, other_level)
+        self.assertNotEqual(base, other_confidence)
+        self.assertEqual(3, len({base, other_level, other_confidence}))
+
+    def test_compound_rows_differing_in_pubchem_are_kept(self) -> None:
+        """Test that compound rows differing only in PubChem compound stay distinct."""
+        base = _compound()
+        other = _compound(pubchem_compound="https://pubchem.ncbi.nlm.nih.gov/compound/713")
+        self.assertNotEqual(base, other)
+        self.assertEqual(2, len({base, other}))
+
+    def test_associations_are_frozen(self) -> None:
+        """Test that fields cannot be reassigned and replace derives a copy."""
+        association = _compound()
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            association.compound_name = "methanal"  # type: ignore[misc]
+        renamed = dataclasses.replace(association, compound_name="methanal")
+        self.assertEqual("methanal", renamed.compound_name)
+        self.assertEqual("formaldehyde", association.compound_name)
+
+    def test_different_types_are_not_equal(self) -> None:
+        """Test that associations of different types never compare equal."""
+        self.assertNotEqual(_compound(), _expression())
+
+
+class TestParseDeduplication(unittest.TestCase):
+    """Test that parsing elements drops duplicate rows."""
+
+    def tearDown(self) -> None:
+        """Clear the global node registry."""
+        CytoscapeNode.clear_registry()
+
+    def test_duplicate_gene_rows(self) -> None:
+        """Test that repeated gene elements parse into one association per row."""
+        with_protein = GeneAssociation(KE_URI, "ENSG1", "P1")
+        without_protein = GeneAssociation(KE_URI, "ENSG2")
+        elements = [
+            *with_protein.to_cytoscape_elements(),
+            *without_protein.to_cytoscape_elements(),
+            *with_protein.to_cytoscape_elements(),
+            *without_protein.to_cytoscape_elements(),
+        ]
+        self.assertEqual(
+            [with_protein, without_protein], GeneAssociation.from_cytoscape_elements(elements)
+        )
+
+    def test_duplicate_component_rows(self) -> None:
+        """Test that repeated component elements parse into one association."""
+        association = ComponentAssociation(
+            ke_uri=KE_URI,
+            ke_name="",
+            process="http://purl.obolibrary.org/obo/GO_0006915",
+            process_name="apoptotic process",
+            object="http://purl.obolibrary.org/obo/PR_000004803",
+            object_name="protein",
+            action="increased",
+            object_type="",
+        )
+        elements = association.to_cytoscape_elements() * 2
+        (parsed,) = ComponentAssociation.from_cytoscape_elements(elements)
+        self.assertEqual(KE_URI, parsed.ke_uri)
+        self.assertEqual(association.process, parsed.process)
+        self.assertEqual(association.object, parsed.object)
+
+
+class TestAssociationNodes(unittest.TestCase):
+    """Test that association nodes follow the global node registry."""
+
+    def tearDown(self) -> None:
+        """Clear the global node registry."""
+        CytoscapeNode.clear_registry()
+
+    def test_nodes_are_registered_after_clearing(self) -> None:
+        """Test that nodes are re-registered after the registry is cleared."""
+        association = GeneAssociation(KE_URI, "ENSG1")
+        (first,) = association.get_nodes()
+        self.assertIs(first, CytoscapeNode.get_existing_node(first.id))
+        CytoscapeNode.clear_registry()
+        (second,) = association.get_nodes()
+        self.assertIsNot(first, second)
+        self.assertIs(second, CytoscapeNode.get_existing_node(second.id))
@@ -0,0 +1,169 @@
+"""Tests for building AOP networks from SPARQL bindings."""
+
+import re
+import unittest
+from typing import Any
+from unittest import mock
+
+from pyaop.aop.aop_info import AOPKeyEvent
+from pyaop.aop.builder import AOPNetworkBuilder, AOPSPARQLProcessor
+from pyaop.aop.constants import NodeType
+from pyaop.cytoscape.elements import CytoscapeNode
+from pyaop.queries.aopwikirdf import AOPQueryService
+
+KE_PREFIX = "https://identifiers.org/aop.events/"
+
+
+def _term(value: str) -> dict[str, str]:
+    """Wrap a value as a SPARQL JSON term."""
+    return {"type": "uri", "value": value}
+
+
+def _aop_binding(aop: str, mie: str, ao: str, upstream: str, downstream: str) -> dict[str, Any]:
+    """Build an AOP query binding from AOP and key event IDs."""
+    return {
+        "aop": _term(f"https://identifiers.org/aop/{aop}"),
+        "aop_title": {"type": "literal", "value": f"AOP {aop}"},
+        "MIE": _term(f"{KE_PREFIX}{mie}"),
+        "MIEtitle": {"type": "literal", "value": f"Event {mie}"},
+        "ao": _term(f"{KE_PREFIX}{ao}"),
+        "ao_title": {"type": "literal", "value": f"Event {ao}"},
+        "KE_upstream": _term(f"{KE_PREFIX}{upstream}"),
+        "KE_upstream_title": {"type": "literal", "value": f"Event {upstream}"},
+        "KE_downstream": _term(f"{KE_PREFIX}{downstream}"),
+        "KE_downstream_title": {"type": "literal", "value": f"Event {downstream}"},
+        "KER": _term(f"https://identifiers.org/aop.relationships/{upstream}{downstream}"),
+    }
+
+
+class TestProcessAOPBindings(unittest.TestCase):
+    """Test processing AOP query bindings into key events and relationships."""
+
+    def setUp(self) -> None:
+        """Create the processor."""
+        self.processor = AOPSPARQLProcessor()
+
+    def test_repeated_rows(self) -> None:
+        """Test that repeated AOP and key event URIs create each object once."""
+        binding = _aop_binding("1", "1", "3", "1", "2")
+        key_events, relationships, aop_infos = self.processor.process_aop_bindings(
+            [binding, binding, _aop_binding("1", "1", "3", "2", "3")]
+        )
+        self.assertEqual(
+            [f"{KE_PREFIX}1", f"{KE_PREFIX}3", f"{KE_PREFIX}2"], [ke.uri for ke in key_events]
+        )
+        self.assertEqual(["1"], [aop.aop_id for aop in aop_infos])
+        for key_event in key_events:
+            self.assertEqual(["1"], key_event.get_aop_ids())
+        self.assertEqual(
+            [NodeType.MIE, NodeType.AO, NodeType.KE], [ke.ke_type for ke in key_events]
+        )
+        for relationship in relationships:
+            self.assertIn(relationship.upstream_ke, key_events)
+            self.assertIn(relationship.downstream_ke, key_events)
+
+    def test_known_key_events_are_reused(self) -> None:
+        """Test that key events from earlier queries are updated, not recreated."""
+        first, _, _ = self.processor.process_aop_bindings([_aop_binding("1", "1", "2", "1", "2")])
+        known = {key_event.uri: key_event for key_event in first}
+        second, relationships, _ = self.processor.process_aop_bindings(
+            [_aop_binding("2", "1", "3", "1", "3")], known
+        )
+        self.assertIs(known[f"{KE_PREFIX}1"], second[0])
+        self.assertEqual(["1", "2"], second[0].get_aop_ids())
+        self.assertEqual(["2"], second[1].get_aop_ids())
+        self.assertIs(known[f"{KE_PREFIX}1"], relationships[0].upstream_ke)
+        # Key events only seen earlier are not returned again
+        self.assertNotIn(known[f"{KE_PREFIX}2"], second)
+
+    def test_repeated_queries_extend_the_network(self) -> None:
+        """Test that querying the builder twice keeps and extends its key events."""
+        builder = AOPNetworkBuilder()
+        responses = [
+            {"results": {"bindings": [_aop_binding("1", "1", "2", "1", "2")]}},
+            {"results": {"bindings": [_aop_binding("2", "1", "3", "1", "3")]}},
+        ]
+        with mock.patch.object(AOPQueryService, "execute_sparql_query", side_effect=responses):
+            network, _ = builder.query_by_identifier("aop", "aop:1", ["a", "b", "c"])
+            mie = network.key_events[f"{KE_PREFIX}1"]
+            network, _ = builder.query_by_identifier("aop", "aop:2", ["a", "b", "c"])
+        self.assertIs(mie, network.key_events[f"{KE_PREFIX}1"])
+        self.assertEqual(["1", "2"], mie.get_aop_ids())
+        self.assertEqual(3, len(network.key_events))
+        self.assertEqual(2, len(network.relationships))
+        for relationship in network.relationships:
+            self.assertIs(mie, relationship.upstream_ke)
+
+
+class TestChunkedQueries(unittest.TestCase):
+    """Test that queries over many URIs are chunked and their results merged."""
+
+    def setUp(self) -> None:
+        """Build a network with enough key events to need several chunks."""
+        CytoscapeNode.clear_registry()
+        self.ke_uris = [f"{KE_PREFIX}{i}" for i in range(1201)]
+        self.builder = AOPNetworkBuilder()
+        self.builder.network.add_key_events_bulk(
+            AOPKeyEvent(str(i), uri, f"Event {i}", NodeType.KE)
+            for i, uri in enumerate(self.ke_uris)
+        )
+
+    def tearDown(self) -> None:
+        """Clear the global node registry."""
+        CytoscapeNode.clear_registry()
+
+    @staticmethod
+    def _answer_organ_query(query: str) -> dict[str, Any]:
+        """Return one organ binding per key event URI in the query."""
+        return {
+            "results": {
+                "bindings": [
+                    {
+                        "ke": _term(uri),
+                        "organ": _term("http://purl.obolibrary.org/obo/UBERON_0002107"),
+                        "organ_name": {"type": "literal", "value": "liver"},
+                    }
+                    for uri in re.findall(rf"<({re.escape(KE_PREFIX)}\d+)>", query)
+                ]
+            }
+        }
+
+    def test_chunk_results_are_merged(self) -> None:
+        """Test that every chunk is queried once and all bindings are processed."""
+        with mock.patch.object(
+            AOPQueryService, "execute_sparql_query", side_effect=self._answer_organ_query
+        ) as execute:
+            network, query = self.builder.query_organs_for_kes()
+        self.assertEqual(3, execute.call_count)
+        self.assertEqual(3, query.count("SELECT"))
+        self.assertEqual(
+            self.ke_uris, [association.ke_uri for association in network.organ_associations]
+        )
+
+    def test_chunk_size_is_set_per_query_type(self) -> None:
+        """Test that each query type chunks with its own size."""
+        with (
+            mock.patch("pyaop.aop.builder._ORGAN_CHUNK_SIZE", 100),
+            mock.patch.object(
+                AOPQueryService, "execute_sparql_query", side_effect=self._answer_organ_query
+            ) as execute,
+        ):
+            result = self.builder._execute_organ_query(self.ke_uris)
+        self.assertEqual(13, execute.call_count)
+        self.assertEqual(
+            self.ke_uris,
+            [binding["ke"]["value"] for binding in result.data["results"]["bindings"]],
+        )
+
+    def test_single_chunk_result_is_returned_as_is(self) -> None:
+        """Test that a query fitting in one chunk returns the endpoint result directly."""
+        uris = self.ke_uris[:10]
+        with mock.patch.object(
+            AOPQueryService, "execute_sparql_query", side_effect=self._answer_organ_query
+        ) as execute:
+            result = self.builder._execute_organ_query(uris)
+        execute.assert_called_once()
+        self.assertTrue(result.success)
+        self.assertEqual(
+            uris, [binding["ke"]["value"] for binding in result.data["results"]["bindings"]]
+        )
@@ -0,0 +1,58 @@
+"""Tests for the AOP network model."""
+
+import unittest
+
+from pyaop.aop.aop_info import AOPInfo, AOPKeyEvent, KeyEventRelationship
+from pyaop.aop.associations import GeneAssociation
+from pyaop.aop.constants import NodeType
+from pyaop.aop.core_model import AOPNetwork
+from pyaop.cytoscape.elements import CytoscapeNode
+
+KE_URI_1 = "https://identifiers.org/aop.events/1"
+KE_URI_2 = "https://identifiers.org/aop.events/2"
+
+
+class TestNetworkExport(unittest.TestCase):
+    """Test the Cytoscape export of a whole network."""
+
+    def setUp(self) -> None:
+        """Build a network whose gene associations share a gene and protein."""
+        CytoscapeNode.clear_registry()
+        aop = AOPInfo("1", "Test AOP", "https://identifiers.org/aop/1")
+        self.mie = AOPKeyEvent("1", KE_URI_1, "MIE", NodeType.MIE, [aop])
+        self.ao = AOPKeyEvent("2", KE_URI_2, "AO", NodeType.AO, [aop])
+        self.relationship = KeyEventRelationship(
+            "3", "https://identifiers.org/aop.relationships/3", self.mie, self.ao
+        )
+        self.gene_1 = GeneAssociation(KE_URI_1, "ENSG1", "P1")
+        self.gene_2 = GeneAssociation(KE_URI_2, "ENSG1", "P1")
+        self.network = AOPNetwork()
+        self.network.add_relationship(self.relationship)
+        self.network.add_gene_association(self.gene_1)
+        self.network.add_gene_association(self.gene_2)
+
+    def tearDown(self) -> None:
+        """Clear the global node registry."""
+        CytoscapeNode.clear_registry()
+
+    def test_element_list(self) -> None:
+        """Test that shared association nodes and edges are exported once, in order."""
+        elements = self.network.to_cytoscape_elements(include_styles=False)["elements"]
+        gene_node, protein_node, translation_edge, first_edge = self.gene_1.to_cytoscape_elements()
+        *shared_elements, second_edge = self.gene_2.to_cytoscape_elements()
+        self.assertEqual([gene_node, protein_node, translation_edge], shared_elements)
+        self.assertEqual(
+            [
+                {"data": self.mie.to_cytoscape_data()},
+                {"data": self.ao.to_cytoscape_data()},
+                {"data": self.relationship.to_cytoscape_data()},
+                gene_node,
+                protein_node,
+                translation_edge,
+                first_edge,
+                second_edge,
+            ],
+            elements,
+        )
+        element_ids = [element["data"]["id"] for element in elements]
+        self.assertEqual(len(element_ids), len(set(element_ids)))